@@ -1,34 +1,195 @@
 """Async wrapper for Chrome DevTools Protocol calls"""
 import asyncio
+import itertools
 from concurrent.futures import ThreadPoolExecutor
-from typing import Any, Dict, Optional
-from threading import Lock
+from typing import Any, Dict, List, Optional, Set, Tuple
 from mcp.logging_config import get_logger
 from mcp.errors import CDPTimeoutError, CDPError
 
 logger = get_logger("browser.async_cdp")
 
+# Message ids for AsyncCDP calls start far above pychrome's own counter (1000+)
+# so direct tab.Domain.method() calls elsewhere never collide with ours
+_FIRST_CALL_ID = 1_000_000_000
+
+# CDP error fragments meaning a cached DOM nodeId belongs to a replaced document
+_STALE_NODE_ERRORS = (
+    "Could not find node with given id",
+    "No node with given id found",
+)
+
+# CDP error fragments meaning a cached objectId died with its execution context
+_STALE_HANDLE_ERRORS = (
+    "Could not find object with given id",
+    "Cannot find context with specified id",
+    "Execution context was destroyed",
+)
+
 
 class AsyncCDP:
     """Async wrapper for synchronous pychrome CDP calls
 
     Provides:
     - Thread-safe CDP calls via executor
+    - Pipelined requests: each call carries its own message id, so
+      independent calls are in flight on the websocket at the same time
+      and pychrome routes every response back to its caller by id
+      (evaluate_batch() fans a list of expressions out this way)
+    - Page helpers: named JS functions installed once per document and
+      invoked via Runtime.callFunctionOn with JSON arguments
     - Configurable timeouts
     - Proper error handling with typed exceptions
     """
 
-    def __init__(self, tab, timeout: float = 30.0):
+    # Page helper registry: name -> JS function declaration (shared by all tabs)
+    _helpers: Dict[str, str] = {}
+    # Helpers that return a Promise and must be awaited by CDP
+    _promise_helpers: Set[str] = set()
+
+    def __init__(self, tab, timeout: float = 30.0, max_concurrency: int = 4):
         """Initialize AsyncCDP wrapper
 
+        All calls share the tab's single long-lived websocket; max_concurrency
+        bounds how many of them may be in flight at once.
+
         Args:
-            tab: pychrome Tab instance
+            tab: pychrome Tab instance (already started)
             timeout: Default timeout for CDP calls in seconds
+            max_concurrency: Maximum number of CDP calls in flight
         """
         self.tab = tab
         self.timeout = timeout
-        self._executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cdp-")
-        self._lock = Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="cdp-")
+        self._ids = itertools.count(_FIRST_CALL_ID)
+
+        # Per-document state, reset whenever the page's execution contexts go away
+        self.page_epoch = 0
+        self._helpers_object_id: Optional[str] = None
+        self._helpers_installed: frozenset = frozenset()
+        self._helpers_lock = asyncio.Lock()
+        self.page_state: Dict[str, Any] = {}  # Command-level cache (e.g. last scroll position)
+
+        self._root_node_id: Optional[int] = None  # DOM.getDocument root, per document
+
+        # Futures waiting for the next Page.loadEventFired, with their loops
+        self._load_waiters: Set[tuple] = set()
+
+        if hasattr(tab, 'set_listener'):
+            tab.set_listener("Runtime.executionContextsCleared", self._on_execution_contexts_cleared)
+            tab.set_listener("Page.loadEventFired", self._on_load_event_fired)
+            tab.set_listener("DOM.documentUpdated", self._on_document_updated)
+
+    @classmethod
+    def register_helper(cls, name: str, function_declaration: str, returns_promise: bool = False):
+        """Register a JS helper installed into every page on first use
+
+        Args:
+            name: Helper name used with call_helper()
+            function_declaration: JS function source, e.g. "function(opts) {...}"
+            returns_promise: Whether the helper is async; only then does
+                call_helper ask CDP to await the result
+        """
+        cls._helpers[name] = function_declaration
+        if returns_promise:
+            cls._promise_helpers.add(name)
+        else:
+            cls._promise_helpers.discard(name)
+
+    def _on_execution_contexts_cleared(self, **kwargs):
+        """Handle Runtime.executionContextsCleared (navigation): drop per-document state"""
+        self.page_epoch += 1
+        self._helpers_object_id = None
+        self._root_node_id = None
+        self.page_state.clear()
+        logger.debug(f"Execution contexts cleared, page epoch {self.page_epoch}")
+
+    def _on_document_updated(self, **kwargs):
+        """Handle DOM.documentUpdated: previously returned nodeIds are invalid"""
+        self._root_node_id = None
+
+    def _on_load_event_fired(self, **kwargs):
+        """Handle Page.loadEventFired (pychrome event thread): wake load waiters
+
+        Waiters are only read here (snapshotted atomically); they unregister
+        themselves on the event loop.
+        """
+        for loop, future in list(self._load_waiters):
+            loop.call_soon_threadsafe(lambda f=future: f.done() or f.set_result(None))
+
+    async def _get_helpers_object_id(self) -> str:
+        """Install registered helpers into the page (once per document)
+
+        The helpers object is reachable only through the returned objectId,
+        never through a window global, so page scripts cannot clobber the
+        helpers or the state they keep on it.
+
+        Returns:
+            objectId of the helpers object
+        """
+        async with self._helpers_lock:
+            names = frozenset(self._helpers)
+            if self._helpers_object_id and names <= self._helpers_installed:
+                return self._helpers_object_id
+
+            body = ",\n".join(f"{name}: {source}" for name, source in self._helpers.items())
+            expression = f"(function() {{ return {{\n{body}\n}}; }})()"
+            response = await self._call_cdp("Runtime.evaluate", expression=expression, returnByValue=False)
+
+            object_id = response.get('result', {}).get('objectId')
+            if not object_id:
+                raise CDPError(f"Failed to install page helpers: {response.get('exceptionDetails', response)}")
+
+            self._helpers_object_id = object_id
+            self._helpers_installed = names
+            logger.debug(f"Page helpers installed: {', '.join(sorted(names))}")
+            return object_id
+
+    async def call_helper(self, name: str, *args, timeout: Optional[float] = None) -> Any:
+        """Call a registered page helper with JSON-serializable arguments
+
+        Promise resolution is awaited only for helpers registered with
+        returns_promise=True.
+
+        Args:
+            name: Helper name (see register_helper)
+            *args: Helper arguments, passed by value (never spliced into JS source)
+            timeout: Override default timeout
+
+        Returns:
+            The helper's return value (already unwrapped from the RemoteObject)
+
+        Raises:
+            CDPTimeoutError: If execution exceeds timeout
+            CDPError: If CDP call fails or the helper throws
+        """
+        if name not in self._helpers:
+            raise CDPError(f"Unknown page helper: {name}")
+
+        arguments = [{"value": arg} for arg in args]
+        for attempt in range(2):
+            object_id = await self._get_helpers_object_id()
+            try:
+                response = await self._call_cdp(
+                    "Runtime.callFunctionOn",
+                    objectId=object_id,
+                    functionDeclaration=f"function() {{ return this.{name}.apply(this, arguments); }}",
+                    arguments=arguments,
+                    returnByValue=True,
+                    awaitPromise=name in self._promise_helpers,
+                    timeout=timeout
+                )
+                break
+            except CDPError as e:
+                # Page navigated since the helpers were installed - reinstall once
+                if attempt or not any(marker in str(e) for marker in _STALE_HANDLE_ERRORS):
+                    raise
+                self._helpers_object_id = None
+
+        if 'exceptionDetails' in response:
+            details = response['exceptionDetails']
+            message = details.get('exception', {}).get('description') or details.get('text', 'Unknown error')
+            raise CDPError(f"Page helper '{name}' threw: {message}")
+        return response['result'].get('value')
 
     async def evaluate(self, expression: str, returnByValue: bool = False,
                       awaitPromise: bool = False,
@@ -56,6 +217,90 @@ class AsyncCDP:
             timeout=timeout
         )
 
+    async def evaluate_batch(self, expressions: List[str], returnByValue: bool = False,
+                             awaitPromise: bool = False,
+                             timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Execute independent JavaScript expressions concurrently
+
+        All messages are sent without waiting for each other's responses
+        (up to max_concurrency in flight), so N evaluations cost about one
+        round-trip instead of N.
+
+        Args:
+            expressions: JavaScript expressions; none may depend on another
+            returnByValue: Whether to return the values directly
+            awaitPromise: Whether to await promise resolution
+            timeout: Override default timeout (per expression)
+
+        Returns:
+            CDP response dicts, in the order of expressions
+
+        Raises:
+            CDPTimeoutError: If any execution exceeds timeout
+            CDPError: If any CDP call fails
+        """
+        return await self.send_batch(
+            [("Runtime.evaluate", {"expression": expression,
+                                   "returnByValue": returnByValue,
+                                   "awaitPromise": awaitPromise})
+             for expression in expressions],
+            timeout=timeout
+        )
+
+    async def send_batch(self, calls: List[Tuple[str, Dict[str, Any]]],
+                         timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Issue independent CDP calls concurrently over the shared websocket
+
+        Each call gets its own message id and responses are matched back by
+        id, so up to max_concurrency calls are in flight at once and the
+        batch costs about one round-trip per max_concurrency calls.
+
+        Args:
+            calls: (method, params) pairs; none may depend on another's result
+            timeout: Override default timeout (per call)
+
+        Returns:
+            CDP results, in the order of calls
+
+        Raises:
+            CDPTimeoutError: If any call exceeds timeout
+            CDPError: If any CDP call fails
+        """
+        return list(await asyncio.gather(*(
+            self._call_cdp(method, timeout=timeout, **params)
+            for method, params in calls
+        )))
+
+    async def _document_node_id(self, timeout: Optional[float] = None) -> int:
+        """Root nodeId of the current document, fetched once per document
+
+        Raises:
+            CDPError: If the document root cannot be resolved
+        """
+        if self._root_node_id is None:
+            doc = await self._call_cdp("DOM.getDocument", timeout=timeout)
+            root_node_id = doc.get("root", {}).get("nodeId")
+            if not root_node_id:
+                raise CDPError("Failed to get document root")
+            self._root_node_id = root_node_id
+        return self._root_node_id
+
+    async def _query_document(self, method: str, selector: str,
+                              timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Run DOM.querySelector(All) against the cached document root
+
+        Retries once with a fresh root if the cached nodeId went stale.
+        """
+        for attempt in range(2):
+            root_node_id = await self._document_node_id(timeout)
+            try:
+                return await self._call_cdp(method, nodeId=root_node_id, selector=selector, timeout=timeout)
+            except CDPError as e:
+                if attempt or not any(err in str(e) for err in _STALE_NODE_ERRORS):
+                    raise
+                logger.debug("Cached document nodeId is stale, fetching the document again")
+                self._root_node_id = None
+
     async def query_selector(self, selector: str, timeout: Optional[float] = None) -> Dict[str, Any]:
         """Query DOM for element matching selector
 
@@ -70,20 +315,7 @@ class AsyncCDP:
             CDPTimeoutError: If query exceeds timeout
             CDPError: If selector is invalid or element not found
         """
-        # First get document
-        doc = await self._call_cdp("DOM.getDocument", timeout=timeout)
-        root_node_id = doc.get("root", {}).get("nodeId")
-
-        if not root_node_id:
-            raise CDPError("Failed to get document root")
-
-        # Then query selector
-        return await self._call_cdp(
-            "DOM.querySelector",
-            nodeId=root_node_id,
-            selector=selector,
-            timeout=timeout
-        )
+        return await self._query_document("DOM.querySelector", selector, timeout)
 
     async def query_selector_all(self, selector: str, timeout: Optional[float] = None) -> Dict[str, Any]:
         """Query DOM for all elements matching selector
@@ -99,20 +331,7 @@ class AsyncCDP:
             CDPTimeoutError: If query exceeds timeout
             CDPError: If selector is invalid
         """
-        # First get document
-        doc = await self._call_cdp("DOM.getDocument", timeout=timeout)
-        root_node_id = doc.get("root", {}).get("nodeId")
-
-        if not root_node_id:
-            raise CDPError("Failed to get document root")
-
-        # Then query all
-        return await self._call_cdp(
-            "DOM.querySelectorAll",
-            nodeId=root_node_id,
-            selector=selector,
-            timeout=timeout
-        )
+        return await self._query_document("DOM.querySelectorAll", selector, timeout)
 
     async def get_outer_html(self, node_id: int, timeout: Optional[float] = None) -> str:
         """Get outer HTML of a DOM node
@@ -157,12 +376,21 @@ class AsyncCDP:
 
         return await self._call_cdp("Page.captureScreenshot", timeout=timeout, **kwargs)
 
-    async def navigate(self, url: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+    async def navigate(self, url: str, timeout: Optional[float] = None,
+                       wait_for_load: bool = False) -> Dict[str, Any]:
         """Navigate to URL
 
+        With wait_for_load, also waits for the page's load event (requires the
+        Page domain to be enabled). The whole call stays within timeout: if the
+        load event has not fired by then, the wait is abandoned and the
+        response returned anyway, as the page is usually usable by that point.
+        Same-document navigations (e.g. to a #fragment) fire no load event and
+        return immediately.
+
         Args:
             url: URL to navigate to
-            timeout: Override default timeout
+            timeout: Override default timeout (covers the load wait too)
+            wait_for_load: Wait for Page.loadEventFired after navigating
 
         Returns:
             CDP response with frameId
@@ -171,7 +399,56 @@ class AsyncCDP:
             CDPTimeoutError: If navigation exceeds timeout
             CDPError: If navigation fails
         """
-        return await self._call_cdp("Page.navigate", url=url, timeout=timeout)
+        if not wait_for_load:
+            return await self._call_cdp("Page.navigate", url=url, timeout=timeout)
+
+        timeout = timeout or self.timeout
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+
+        # Register before navigating so a fast load cannot be missed
+        waiter = (loop, loop.create_future())
+        self._load_waiters.add(waiter)
+        try:
+            response = await self._call_cdp("Page.navigate", url=url, timeout=timeout)
+            if response.get('loaderId'):
+                try:
+                    await asyncio.wait_for(waiter[1], timeout=max(deadline - loop.time(), 0))
+                except asyncio.TimeoutError:
+                    logger.warning(f"Load event not fired within {timeout}s: {url}")
+            return response
+        finally:
+            self._load_waiters.discard(waiter)
+
+    async def dispatch_mouse_event(self, event_type: str, x: float, y: float,
+                                   button: str = "none", click_count: int = 0,
+                                   timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Dispatch a native mouse event (no page JS involved)
+
+        Args:
+            event_type: mousePressed, mouseReleased, mouseMoved or mouseWheel
+            x: X coordinate in CSS pixels relative to the viewport
+            y: Y coordinate in CSS pixels relative to the viewport
+            button: Mouse button (none, left, middle, right)
+            click_count: Number of times the button was clicked
+            timeout: Override default timeout
+
+        Returns:
+            CDP response (empty on success)
+
+        Raises:
+            CDPTimeoutError: If call exceeds timeout
+            CDPError: If call fails
+        """
+        return await self._call_cdp(
+            "Input.dispatchMouseEvent",
+            type=event_type,
+            x=x,
+            y=y,
+            button=button,
+            clickCount=click_count,
+            timeout=timeout
+        )
 
     async def call_function_on(self, object_id: str, function_declaration: str,
                               arguments: Optional[list] = None,
@@ -217,25 +494,25 @@ class AsyncCDP:
         """
         timeout = timeout or self.timeout
 
+        # Allocate the message id up front (itertools.count is atomic under the GIL);
+        # pychrome's own id counter is not safe to share between worker threads
+        message = {"id": next(self._ids), "method": method, "params": kwargs}
+
         def _sync_call():
             """Synchronous CDP call in thread"""
-            with self._lock:
-                try:
-                    # Parse method into domain and command
-                    domain, command = method.split(".", 1)
-
-                    # Get domain object and call method
-                    domain_obj = getattr(self.tab, domain)
-                    method_fn = getattr(domain_obj, command)
+            try:
+                response = self.tab._send(message, timeout=timeout)
+            except Exception as e:
+                raise CDPError(f"CDP call failed: {method}: {str(e)}") from e
 
-                    result = method_fn(**kwargs)
-                    logger.debug(f"CDP call succeeded: {method}")
-                    return result
+            if 'result' not in response and 'error' in response:
+                error = response['error']
+                if error.get('code') == -32601:
+                    raise CDPError(f"Invalid CDP method: {method}")
+                raise CDPError(f"CDP call failed: {method}: {error.get('message', error)}")
 
-                except AttributeError as e:
-                    raise CDPError(f"Invalid CDP method: {method}") from e
-                except Exception as e:
-                    raise CDPError(f"CDP call failed: {method}: {str(e)}") from e
+            logger.debug(f"CDP call succeeded: {method}")
+            return response['result']
 
         try:
             loop = asyncio.get_event_loop()
@@ -247,11 +524,7 @@ class AsyncCDP:
 
         except asyncio.TimeoutError:
             logger.error(f"CDP call timeout: {method} (timeout={timeout}s)")
-            raise CDPTimeoutError(
-                f"CDP call timeout: {method}",
-                method=method,
-                timeout=timeout
-            )
+            raise CDPTimeoutError(method, timeout)
         except CDPError:
             # Re-raise typed CDP errors
             raise
@@ -260,6 +533,11 @@ class AsyncCDP:
             raise CDPError(f"CDP call failed: {method}: {str(e)}")
 
     async def close(self):
-        """Shutdown executor"""
+        """Shutdown executor
+
+        Does not wait for calls still running (e.g. background cursor moves on
+        a tab being switched away from): they finish or time out on their own
+        threads instead of blocking the event loop.
+        """
         logger.debug("Shutting down AsyncCDP executor")
-        self._executor.shutdown(wait=True)
+        self._executor.shutdown(wait=False)
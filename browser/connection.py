@@ -3,6 +3,7 @@ import sys
 import os
 import asyncio
 from typing import Optional
+import aiohttp
 import pychrome
 from .cursor import AICursor
 from .async_cdp import AsyncCDP
@@ -121,6 +122,7 @@ class BrowserConnection:
         self.browser: Optional[pychrome.Browser] = None
         self.tab: Optional[pychrome.Tab] = None
         self.cdp: Optional[AsyncCDP] = None  # Async CDP wrapper
+        self._http_session: Optional[aiohttp.ClientSession] = None  # See http_session()
         self.console_logs = []  # Store console logs from CDP events
         self.cursor: Optional[AICursor] = None
 
@@ -156,6 +158,29 @@ class BrowserConnection:
         except Exception as e:
             raise MCPConnectionError(f"Failed to ensure connection: {str(e)}")
 
+    async def rebind_cdp(self):
+        """Point the AsyncCDP wrapper at the current tab's websocket
+
+        Called after the active tab changes: the previous wrapper still targets
+        the old (stopped) tab, so the next health check would fail and reconnect
+        to the first tab instead.
+        """
+        old_cdp = self.cdp
+        self.cdp = AsyncCDP(self.tab, timeout=old_cdp.timeout if old_cdp else 30.0)
+        if old_cdp:
+            await old_cdp.close()
+        logger.debug("AsyncCDP wrapper rebound to current tab")
+
+    def http_session(self) -> aiohttp.ClientSession:
+        """Shared async HTTP client for the browser's debug endpoints (/json...)
+
+        Created lazily on the running event loop and reused by every command,
+        so keep-alive connections survive between calls. Closed by close().
+        """
+        if self._http_session is None or self._http_session.closed:
+            self._http_session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
+        return self._http_session
+
     async def connect(self):
         """Connect to the existing Comet browser instance"""
         try:
@@ -181,7 +206,6 @@ class BrowserConnection:
 
             # Enable necessary domains
             self.tab.Page.enable()
-            self.tab.DOM.enable()
             self.tab.Runtime.enable()
             self.tab.Console.enable()
             self.tab.Network.enable()
@@ -202,6 +226,7 @@ class BrowserConnection:
             # Initialize AI cursor
             self.cursor = AICursor(self.tab)
             await self.cursor.initialize()
+            await self.cursor.register_for_new_documents()
 
             # STABILITY FIX: Start background health check loop
             # Stop existing task if any (reconnection scenario)
@@ -470,6 +495,10 @@ class BrowserConnection:
             if self.cdp:
                 await self.cdp.close()
 
+            if self._http_session:
+                await self._http_session.close()
+                self._http_session = None
+
             if self.tab:
                 self.tab.stop()
         except Exception as e:
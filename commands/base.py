@@ -18,8 +18,16 @@ class Command(ABC):
         requires_console_logs: bool = False - Command needs console logs
         requires_connection: bool = False - Command needs full connection
         requires_cdp: bool = False - Command needs AsyncCDP wrapper
+
+    Page state (optional class attribute):
+        preserves_page_state: bool = False - Command leaves AsyncCDP.page_state
+            (cached scroll position etc.) valid; all other commands clear it
     """
 
+    # Per-instance state set in __init__ (commands are created per call).
+    # Subclasses declare __slots__ = () so their instances get no __dict__
+    __slots__ = ('context', 'tab', 'cdp', 'cursor', 'browser', 'console_logs', 'connection')
+
     # Class attributes - must be overridden by subclasses
     name: str = None
     description: str = None
@@ -32,6 +40,9 @@ class Command(ABC):
     requires_connection: bool = False
     requires_cdp: bool = False
 
+    # Page state cache - cleared before commands that may change the page
+    preserves_page_state: bool = False
+
     def __init__(self, context: CommandContext):
         """Initialize command with execution context
 
@@ -1,16 +1,79 @@
 """DevTools commands: console, network, element inspection"""
+import json
 from typing import Dict, Any, Optional
 from .base import Command
 from .registry import register
 from mcp.logging_config import get_logger
+from utils.page_scraper import PageScraper
 
 logger = get_logger("commands.devtools")
 
+# Page data written by get_console_logs (built once at import)
+_CONSOLE_PAGE_DATA_JS = """
+(function() {
+    // Get all interactive elements: one pass over the NodeList, one rect each
+    const interactive = [];
+    const selector = 'button, a, input, select, textarea, [role="button"], [role="tab"], [onclick]';
+    for (const el of document.querySelectorAll(selector)) {
+        const rect = el.getBoundingClientRect();
+        if (!(rect.width > 0 && rect.height > 0 &&
+              el.offsetParent !== null &&
+              window.getComputedStyle(el).visibility !== 'hidden')) {
+            continue;
+        }
+        interactive.push({
+            tag: el.tagName.toLowerCase(),
+            type: el.type || el.getAttribute('role') || 'unknown',
+            text: el.textContent.trim().substring(0, 100),
+            id: el.id || null,
+            className: el.className || null,
+            position: {
+                x: Math.round(rect.left + rect.width/2),
+                y: Math.round(rect.top + rect.height/2),
+                width: Math.round(rect.width),
+                height: Math.round(rect.height)
+            }
+        });
+    }
+
+    // Get console logs
+    const consoleLogs = window.__consoleHistory || [];
+
+    // Get network info (failures counted without an intermediate array)
+    const networkEntries = performance.getEntriesByType('resource') || [];
+    let failedRequests = 0;
+    for (const entry of networkEntries) {
+        if (entry.transferSize === 0) failedRequests++;
+    }
+
+    return {
+        url: window.location.href,
+        title: document.title,
+        interactive_elements: interactive,
+        console: {
+            logs: consoleLogs.slice(-10),
+            total: consoleLogs.length
+        },
+        network: {
+            total_requests: networkEntries.length,
+            failed: failedRequests
+        },
+        summary: {
+            total_interactive: interactive.length,
+            buttons: interactive.filter(e => e.tag === 'button').length,
+            links: interactive.filter(e => e.tag === 'a').length
+        }
+    };
+})()
+"""
+
 
 @register
 class OpenDevtoolsCommand(Command):
     """Open DevTools (F12)"""
 
+    __slots__ = ()
+
     name = "open_devtools"
     description = "Open DevTools (F12) in the browser"
     input_schema = {
@@ -26,7 +89,7 @@ class OpenDevtoolsCommand(Command):
             js_code = """
             (function() {
                 if (window.chrome && window.chrome.devtools) {
-                    return {success: true, message: 'DevTools already open'};
+                    return;
                 }
                 const event = new KeyboardEvent('keydown', {
                     key: 'F12',
@@ -36,11 +99,11 @@ class OpenDevtoolsCommand(Command):
                     bubbles: true
                 });
                 document.dispatchEvent(event);
-                return {success: true, message: 'DevTools open command sent'};
             })()
             """
             # Use AsyncCDP wrapper for thread-safe evaluation (STABILITY FIX)
-            await self.context.cdp.evaluate(expression=js_code, returnByValue=True)
+            # Script returns undefined: nothing is serialized back since the result is unused
+            await self.context.cdp.evaluate(expression=js_code)
             return {
                 "success": True,
                 "message": "DevTools opened (F12). Note: UI may not show via CDP, but debugging is active.",
@@ -54,6 +117,8 @@ class OpenDevtoolsCommand(Command):
 class CloseDevtoolsCommand(Command):
     """Close DevTools"""
 
+    __slots__ = ()
+
     name = "close_devtools"
     description = "Close DevTools in the browser"
     input_schema = {
@@ -76,11 +141,11 @@ class CloseDevtoolsCommand(Command):
                     bubbles: true
                 });
                 document.dispatchEvent(event);
-                return {success: true, message: 'DevTools close command sent'};
             })()
             """
             # Use AsyncCDP wrapper for thread-safe evaluation (STABILITY FIX)
-            await self.context.cdp.evaluate(expression=js_code, returnByValue=True)
+            # Script returns undefined: nothing is serialized back since the result is unused
+            await self.context.cdp.evaluate(expression=js_code)
             return {"success": True, "message": "DevTools closed (F12)"}
         except Exception as e:
             raise RuntimeError(f"Failed to close DevTools: {str(e)}")
@@ -90,6 +155,8 @@ class CloseDevtoolsCommand(Command):
 class ConsoleCommandCommand(Command):
     """Execute console command"""
 
+    __slots__ = ()
+
     name = "console_command"
     description = "Execute a command in the DevTools console and get the result"
     input_schema = {
@@ -184,6 +251,8 @@ class ConsoleCommandCommand(Command):
 class GetConsoleLogsCommand(Command):
     """Retrieve console logs"""
 
+    __slots__ = ()
+
     name = "get_console_logs"
     description = """Get console logs from the browser.
 
@@ -200,77 +269,15 @@ After calling this, use Read('./page_info.json') to see console logs."""
 
     async def execute(self, clear: bool = False, **kwargs) -> Dict[str, Any]:
         """Auto-redirect to save_page_info (workaround for MCP output issue)"""
-        import json
-        import os
-
         try:
             # Call save_page_info logic inline
-            js_code = """
-            (function() {
-                // Get all interactive elements
-                const selector = 'button, a, input, select, textarea, [role="button"], [role="tab"], [onclick]';
-                const elements = Array.from(document.querySelectorAll(selector));
-
-                const interactive = elements
-                    .filter(el => {
-                        const rect = el.getBoundingClientRect();
-                        const style = window.getComputedStyle(el);
-                        return rect.width > 0 && rect.height > 0 &&
-                               el.offsetParent !== null &&
-                               style.visibility !== 'hidden';
-                    })
-                    .map(el => {
-                        const rect = el.getBoundingClientRect();
-                        return {
-                            tag: el.tagName.toLowerCase(),
-                            type: el.type || el.getAttribute('role') || 'unknown',
-                            text: el.textContent.trim().substring(0, 100),
-                            id: el.id || null,
-                            className: el.className || null,
-                            position: {
-                                x: Math.round(rect.left + rect.width/2),
-                                y: Math.round(rect.top + rect.height/2),
-                                width: Math.round(rect.width),
-                                height: Math.round(rect.height)
-                            }
-                        };
-                    });
-
-                // Get console logs
-                const consoleLogs = window.__consoleHistory || [];
-
-                // Get network info
-                const networkEntries = performance.getEntriesByType('resource') || [];
 
-                return {
-                    url: window.location.href,
-                    title: document.title,
-                    interactive_elements: interactive,
-                    console: {
-                        logs: consoleLogs.slice(-10),
-                        total: consoleLogs.length
-                    },
-                    network: {
-                        total_requests: networkEntries.length,
-                        failed: networkEntries.filter(e => e.transferSize === 0).length
-                    },
-                    summary: {
-                        total_interactive: interactive.length,
-                        buttons: interactive.filter(e => e.tag === 'button').length,
-                        links: interactive.filter(e => e.tag === 'a').length
-                    }
-                };
-            })()
-            """
-
-            result = self.tab.Runtime.evaluate(expression=js_code, returnByValue=True)
+            result = self.tab.Runtime.evaluate(expression=_CONSOLE_PAGE_DATA_JS, returnByValue=True)
             page_data = result.get('result', {}).get('value', {})
 
             # Save to file
             output_file = "./page_info.json"
-            os.makedirs(os.path.dirname(os.path.abspath(output_file)), exist_ok=True)
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(page_data, f, indent=2, ensure_ascii=False)
+            await PageScraper.write_json(page_data, output_file)
 
             return {
                 "success": True,
@@ -296,6 +303,8 @@ After calling this, use Read('./page_info.json') to see console logs."""
 class InspectElementCommand(Command):
     """Inspect element like DevTools"""
 
+    __slots__ = ()
+
     name = "inspect_element"
     description = "Inspect an element like DevTools inspector (get HTML, attributes, styles, position)"
     input_schema = {
@@ -312,8 +321,8 @@ class InspectElementCommand(Command):
         """Inspect element properties, styles, and position"""
         try:
             # Try to find element using JS first (supports more complex selectors)
-            # Escape single quotes in selector for JS string
-            selector_escaped = selector.replace("'", "\\'")
+            # JSON string literals are valid JS and survive quotes/backslashes
+            selector_escaped = json.dumps(selector)
 
             js_find_code = f"""
             (function() {{
@@ -321,18 +330,18 @@ class InspectElementCommand(Command):
 
                 // Try direct querySelector first
                 try {{
-                    el = document.querySelector('{selector_escaped}');
+                    el = document.querySelector({selector_escaped});
                 }} catch(e) {{
                     // Selector might not be valid CSS
                 }}
 
                 // If selector contains :has-text or similar pseudo-selectors
-                if (!el && '{selector}'.includes('has-text')) {{
+                if (!el && {selector_escaped}.includes('has-text')) {{
                     // Extract text from selector like button:has-text("Тестирование")
-                    const textMatch = '{selector}'.match(/has-text\\(["']([^"']+)["']\\)/);
+                    const textMatch = {selector_escaped}.match(/has-text\\(["']([^"']+)["']\\)/);
                     if (textMatch) {{
                         const searchText = textMatch[1];
-                        const tagMatch = '{selector}'.match(/^([a-z]+):/);
+                        const tagMatch = {selector_escaped}.match(/^([a-z]+):/);
                         const tag = tagMatch ? tagMatch[1] : '*';
 
                         const elements = Array.from(document.querySelectorAll(tag));
@@ -341,7 +350,7 @@ class InspectElementCommand(Command):
                 }}
 
                 if (!el) {{
-                    return {{success: false, message: 'Element not found: {selector}'}};
+                    return {{success: false, message: 'Element not found: ' + {selector_escaped}}};
                 }}
 
                 const styles = window.getComputedStyle(el);
@@ -409,6 +418,8 @@ class InspectElementCommand(Command):
 class GetNetworkActivityCommand(Command):
     """Get network activity"""
 
+    __slots__ = ()
+
     name = "get_network_activity"
     description = "Get network activity like DevTools Network panel (resources, timings, sizes)"
     input_schema = {
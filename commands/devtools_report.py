@@ -11,6 +11,8 @@ logger = get_logger("commands.devtools_report")
 class DevToolsReportCommand(Command):
     """Generate comprehensive DevTools debugging report"""
 
+    __slots__ = ()
+
     name = "devtools_report"
     description = """Generate comprehensive DevTools debugging report.
 
@@ -11,6 +11,8 @@ logger = get_logger("commands.diagnostics")
 class EnableConsoleLoggingCommand(Command):
     """Force enable console logging"""
 
+    __slots__ = ()
+
     name = "enable_console_logging"
     description = "Force enable console logging if get_console_logs returns empty results"
     input_schema = {
@@ -34,6 +36,8 @@ class EnableConsoleLoggingCommand(Command):
 class DiagnosePageCommand(Command):
     """Diagnose page state and connection"""
 
+    __slots__ = ()
+
     name = "diagnose_page"
     description = "Diagnose page state, connection, and common issues"
     input_schema = {
@@ -68,9 +72,9 @@ class DiagnosePageCommand(Command):
                         consoleInterceptor: window.__consoleInterceptorInstalled ? 'installed' : 'not installed'
                     },
                     counts: {
-                        buttons: document.querySelectorAll('button').length,
-                        links: document.querySelectorAll('a').length,
-                        inputs: document.querySelectorAll('input').length,
+                        buttons: document.getElementsByTagName('button').length,
+                        links: document.getElementsByTagName('a').length,
+                        inputs: document.getElementsByTagName('input').length,
                         tabs: document.querySelectorAll('[role="tab"]').length
                     },
                     devtools: {
@@ -100,6 +104,8 @@ class DiagnosePageCommand(Command):
 class GetClickableElementsCommand(Command):
     """Get all clickable elements on page"""
 
+    __slots__ = ()
+
     name = "get_clickable_elements"
     description = "Get all clickable elements with their positions (for finding hard-to-click elements)"
     input_schema = {
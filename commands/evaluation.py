@@ -1,10 +1,10 @@
 """JavaScript evaluation command"""
 from typing import Dict, Any
 import json
-import os
 from .base import Command
 from .registry import register
 from mcp.logging_config import get_logger
+from utils.page_scraper import PageScraper
 
 logger = get_logger(__name__)
 
@@ -13,6 +13,8 @@ logger = get_logger(__name__)
 class EvaluateJsCommand(Command):
     """Execute JavaScript code in browser with smart output handling"""
 
+    __slots__ = ()
+
     name = "evaluate_js"
     description = """Execute JavaScript code in the browser and return the result.
 
@@ -86,7 +88,7 @@ Examples:
             # Check if result is too large (>2KB) -> save to file
             result_str = json.dumps(formatted_result, ensure_ascii=False)
             if len(result_str) > 2048:
-                return self._save_large_result(formatted_result, console_output, code)
+                return await self._save_large_result(formatted_result, console_output, code)
 
             # Small result - return directly
             response = {
@@ -288,7 +290,7 @@ Examples:
             "message": "JavaScript code threw an exception"
         }
 
-    def _save_large_result(self, result: Any, console_output: list, code: str) -> Dict[str, Any]:
+    async def _save_large_result(self, result: Any, console_output: list, code: str) -> Dict[str, Any]:
         """Save large results to file"""
         output_file = "./js_result.json"
 
@@ -303,9 +305,7 @@ Examples:
                 }
             }
 
-            os.makedirs(os.path.dirname(os.path.abspath(output_file)) or '.', exist_ok=True)
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            await PageScraper.write_json(data, output_file)
 
             logger.info(f"[evaluate_js] Large result saved to {output_file}")
 
@@ -14,6 +14,8 @@ logger = get_logger(__name__)
 class FillInputCommand(Command):
     """Fill text input or textarea field"""
 
+    __slots__ = ()
+
     name = "fill_input"
     description = """Fill an input or textarea field with text (v3.0.0 feature).
 
@@ -135,6 +137,8 @@ Tip: Use save_page_info() first to see available input fields."""
 class SelectOptionCommand(Command):
     """Select option in dropdown/select element"""
 
+    __slots__ = ()
+
     name = "select_option"
     description = """Select an option in a dropdown/select element (v3.0.0 feature).
 
@@ -277,6 +281,8 @@ Tip: Use save_page_info() to see available options."""
 class CheckCheckboxCommand(Command):
     """Check or uncheck a checkbox"""
 
+    __slots__ = ()
+
     name = "check_checkbox"
     description = """Check or uncheck a checkbox (v3.0.0 feature).
 
@@ -375,6 +381,8 @@ Tip: Use save_page_info() to see checkbox states."""
 class SubmitFormCommand(Command):
     """Submit a form"""
 
+    __slots__ = ()
+
     name = "submit_form"
     description = """Submit a form by selector or by clicking its submit button (v3.0.0 feature).
 
@@ -1,4 +1,5 @@
 """Helper commands for debugging and advanced interactions"""
+import json
 from typing import Dict, Any
 from .base import Command
 from .registry import register
@@ -11,6 +12,8 @@ logger = get_logger("commands.helpers")
 class DebugElementCommand(Command):
     """Debug element to see all available click methods"""
 
+    __slots__ = ()
+
     name = "debug_element"
     description = "Debug an element to see all ways to interact with it (for troubleshooting clicks)"
     input_schema = {
@@ -27,22 +30,25 @@ class DebugElementCommand(Command):
         """Debug element and return all possible selectors and click methods"""
         try:
             search_strategy = f"text='{text}'" if text else f"selector='{selector}'"
+            # JSON string literals are valid JS and survive quotes in the input
+            text_escaped = json.dumps(text or "")
+            selector_escaped = json.dumps(selector or "")
 
             js_code = f"""
             (function() {{
                 let elements = [];
 
                 // Search by text if provided
-                if ('{text}') {{
-                    const searchText = '{text}';
-                    elements = Array.from(document.querySelectorAll('*'))
+                if ({text_escaped}) {{
+                    const searchText = {text_escaped};
+                    elements = Array.from(document.getElementsByTagName('*'))
                         .filter(el => el.textContent.includes(searchText) && el.children.length === 0);
-                }} else if ('{selector}') {{
-                    elements = Array.from(document.querySelectorAll('{selector}'));
+                }} else if ({selector_escaped}) {{
+                    elements = Array.from(document.querySelectorAll({selector_escaped}));
                 }}
 
                 if (elements.length === 0) {{
-                    return {{success: false, message: 'No elements found for {search_strategy}'}};
+                    return {{success: false, message: 'No elements found for ' + {json.dumps(search_strategy)}}};
                 }}
 
                 // Analyze each element
@@ -133,6 +139,8 @@ class DebugElementCommand(Command):
 class ForceClickCommand(Command):
     """Force click using multiple aggressive strategies"""
 
+    __slots__ = ()
+
     name = "force_click"
     description = "Force click on element using all available methods (use when normal click fails)"
     input_schema = {
@@ -253,12 +261,12 @@ class ForceClickCommand(Command):
                 # Find by text and force click
                 js_code = f"""
                 (function() {{
-                    const searchText = '{text}';
-                    const elements = Array.from(document.querySelectorAll('*'))
+                    const searchText = {json.dumps(text)};
+                    const elements = Array.from(document.getElementsByTagName('*'))
                         .filter(el => el.textContent.includes(searchText) && el.children.length === 0);
 
                     if (elements.length === 0) {{
-                        return {{success: false, message: 'No elements with text: {text}'}};
+                        return {{success: false, message: 'No elements with text: ' + searchText}};
                     }}
 
                     const el = elements[0];
@@ -308,7 +316,7 @@ class ForceClickCommand(Command):
                                 }},
                                 methods: methods,
                                 position: {{x: Math.round(x), y: Math.round(y)}},
-                                message: 'Executed ' + methods.length + ' click methods on text: {text}'
+                                message: 'Executed ' + methods.length + ' click methods on text: ' + searchText
                             }});
                         }}, 350);
                     }});
@@ -1,20 +1,1032 @@
 """Interactive browser commands: click, scroll, cursor movement"""
 import asyncio
+import time
 from typing import Dict, Any, Optional
 from .base import Command
 from .registry import register
 from mcp.logging_config import get_logger
-from mcp.errors import InvalidArgumentError, CommandError
+from mcp.errors import InvalidArgumentError, CommandError, ValidationError, CDPError
 from utils.validators import Validators
 from utils.cache_manager import get_element_search_cache
+from browser.async_cdp import AsyncCDP
 
 logger = get_logger("commands.interaction")
 
+# Page helpers for scroll/move: installed once per document by AsyncCDP and
+# called with an options object, so no per-call JS source is shipped or parsed
+_SCROLL_HELPER_JS = """function(opts) {
+    // DOM-derived state is memoized on the helpers object (this) and rebuilt
+    // when the shared watcher (dom_watch) reports a change that can affect
+    // it: looked-up elements on DOM mutations, the page size also on
+    // resizes and late-loading resources
+    const helpers = this;
+    function domState() {
+        const watch = helpers.dom_watch();
+        let state = helpers.__domState__;
+        if (!state) {
+            state = helpers.__domState__ = {sizeKey: null, width: 0, height: 0, elements: new Map(), elementsKey: null};
+        }
+        if (state.elementsKey !== watch.mutations) {
+            state.elements.clear();
+            state.elementsKey = watch.mutations;
+        }
+        state.watch = watch;
+        return state;
+    }
+
+    function pageSize() {
+        const state = domState();
+        const sizeKey = state.watch.mutations + ':' + state.watch.layout;
+        if (state.sizeKey !== sizeKey) {
+            state.width = document.documentElement.scrollWidth;
+            state.height = document.documentElement.scrollHeight;
+            state.sizeKey = sizeKey;
+        }
+        return state;
+    }
+
+    function findElement(selector) {
+        const elements = domState().elements;
+        let el = elements.get(selector);
+        if (!el) {
+            el = document.querySelector(selector);
+            if (el) elements.set(selector, el);
+        }
+        return el;
+    }
+
+    // Default payload is {x, y} only: scroll offsets are cheap, while page/element
+    // size metrics are only returned when opts.detailed
+    function pagePosition(withEdges) {
+        const position = {x: window.scrollX, y: window.scrollY};
+        if (!opts.detailed) return position;
+
+        // Each geometry value is read once into a local and reused
+        const size = pageSize();
+        const viewportWidth = window.innerWidth;
+        const viewportHeight = window.innerHeight;
+        position.maxX = size.width - viewportWidth;
+        position.maxY = size.height - viewportHeight;
+        position.viewportHeight = viewportHeight;
+        position.viewportWidth = viewportWidth;
+        position.pageHeight = size.height;
+        position.pageWidth = size.width;
+        if (withEdges) {
+            position.scrolledToBottom = (viewportHeight + position.y) >= size.height - 10;
+            position.scrolledToTop = position.y <= 10;
+        }
+        return position;
+    }
+
+    if (opts.mode === 'xy') {
+        window.scrollTo(opts.x, opts.y);
+        return pagePosition(false);
+    }
+
+    if (opts.mode === 'selector') {
+        const el = findElement(opts.selector);
+        if (!el) return {success: false, message: 'Element not found: ' + opts.selector};
+
+        const forward = opts.direction === 'down' || opts.direction === 'right';
+        const delta = forward ? opts.amount : -opts.amount;
+        if (opts.direction === 'down' || opts.direction === 'up') {
+            el.scrollTop += delta;
+        } else {
+            el.scrollLeft += delta;
+        }
+
+        const info = {
+            success: true,
+            element: opts.selector,
+            scrollTop: el.scrollTop,
+            scrollLeft: el.scrollLeft
+        };
+        if (opts.detailed) {
+            info.scrollHeight = el.scrollHeight;
+            info.scrollWidth = el.scrollWidth;
+            info.clientHeight = el.clientHeight;
+            info.clientWidth = el.clientWidth;
+        }
+        return info;
+    }
+
+    const beforeX = window.scrollX;
+    const beforeY = window.scrollY;
+    switch (opts.direction) {
+        case 'down': window.scrollBy(0, opts.amount); break;
+        case 'up': window.scrollBy(0, -opts.amount); break;
+        case 'left': window.scrollBy(-opts.amount, 0); break;
+        case 'right': window.scrollBy(opts.amount, 0); break;
+        case 'top': window.scrollTo(0, 0); break;
+        case 'bottom': window.scrollTo(0, pageSize().height); break;
+    }
+    const position = pagePosition(true);
+    // Moved less than asked: the page hit its end in this direction
+    position.limited = opts.direction === 'bottom'
+        || (opts.direction === 'down' && position.y - beforeY < opts.amount - 1)
+        || (opts.direction === 'right' && position.x - beforeX < opts.amount - 1);
+    return position;
+}"""
+
+_MOVE_HELPER_JS = """function(opts) {
+    let centerX = opts.x;
+    let centerY = opts.y;
+    let el = null;
+    let rect = null;
+
+    if (opts.selector) {
+        el = document.querySelector(opts.selector);
+        if (!el) {
+            return {success: false, message: 'Element not found: ' + opts.selector};
+        }
+        rect = el.getBoundingClientRect();
+        centerX = rect.left + rect.width / 2;
+        centerY = rect.top + rect.height / 2;
+    }
+
+    if (!window.__moveAICursor__) {
+        return {success: false, message: 'AI cursor not initialized'};
+    }
+    window.__moveAICursor__(centerX, centerY, opts.duration);
+
+    if (!el) {
+        return {
+            success: true,
+            message: 'Cursor moved to coordinates',
+            position: {x: centerX, y: centerY}
+        };
+    }
+    return {
+        success: true,
+        message: 'Cursor moved to element: ' + opts.selector,
+        position: {x: centerX, y: centerY},
+        element: {
+            tagName: el.tagName,
+            id: el.id,
+            className: el.className,
+            bounds: {
+                top: rect.top,
+                left: rect.left,
+                width: rect.width,
+                height: rect.height
+            }
+        }
+    };
+}"""
+
+# Page-internal helpers shared by the click helpers (they take DOM nodes or
+# promises, so they are called as this.<name>() in the page, not via call_helper)
+_WAIT_IN_VIEW_HELPER_JS = """function(el, timeoutMs) {
+    // Resolve once the element is (almost) fully visible, or after timeoutMs
+    return new Promise(resolve => {
+        if (typeof IntersectionObserver !== 'function') {
+            setTimeout(resolve, timeoutMs);
+            return;
+        }
+        let timer = null;
+        const observer = new IntersectionObserver(entries => {
+            if (entries.some(entry => entry.intersectionRatio > 0.9)) {
+                finish();
+            }
+        }, {threshold: [0.9, 1]});
+        function finish() {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve();
+        }
+        timer = setTimeout(finish, timeoutMs);
+        observer.observe(el);
+    });
+}"""
+
+_SLICE_TRIM_HELPER_JS = """function(s, n) {
+    // Same as s.trim().substring(0, n), but only the leading and trailing
+    // whitespace is scanned, so long texts are never copied whole
+    let start = 0;
+    let end = s.length;
+    while (start < end && /\\s/.test(s[start])) start++;
+    while (end > start && /\\s/.test(s[end - 1])) end--;
+    return s.slice(start, Math.min(start + n, end));
+}"""
+
+_PRESS_AND_CLICK_HELPER_JS = """function(el, x, y) {
+    // Exactly one click activation: el.click() fires click plus its default
+    // action, so no extra synthetic click or direct onclick call follows it.
+    // It is preceded by the press events a real mouse sends, since menus and
+    // selects often open on pointerdown/mousedown. Returns whether it clicked
+    const mouse = {view: window, bubbles: true, cancelable: true, clientX: x, clientY: y, button: 0};
+    const pointer = Object.assign({pointerId: 1, pointerType: 'mouse', isPrimary: true}, mouse);
+    try {
+        el.dispatchEvent(new PointerEvent('pointerdown', pointer));
+        el.dispatchEvent(new MouseEvent('mousedown', mouse));
+        el.dispatchEvent(new PointerEvent('pointerup', pointer));
+        el.dispatchEvent(new MouseEvent('mouseup', mouse));
+    } catch (e) {
+        console.warn('[MCP] Press events failed:', e);
+    }
+
+    // Synthetic events do not move focus; a real click on these would
+    const focusable = el.tagName === 'BUTTON' || el.tagName === 'A' || el.tagName === 'INPUT';
+    try {
+        el.click();
+        if (focusable) el.focus();
+        return true;
+    } catch (e) {
+        console.warn('[MCP] Direct click failed:', e);
+    }
+
+    // Last resort: call the onclick property directly
+    try {
+        if (focusable) el.focus();
+        if (el.onclick) {
+            el.onclick.call(el);
+            return true;
+        }
+    } catch (e) {
+        console.warn('[MCP] Focus/onclick failed:', e);
+    }
+    return false;
+}"""
+
+_DOM_WATCH_HELPER_JS = """function() {
+    // The one document-wide watcher behind every helper that memoizes
+    // DOM-derived state on the helpers object. Counters only ever grow: a
+    // helper remembers the counters its cache was built at and rebuilds it
+    // when they have moved
+    //  - mutations: any DOM change
+    //  - texts: a change that can alter element texts or text labels
+    //  - layout: viewport resize, late-loading resources, body resize
+    //  - scrolls: any scroll, of the page or of an inner container
+    let watch = this.__domWatch__;
+    if (!watch) {
+        watch = this.__domWatch__ = {mutations: 0, texts: 0, layout: 0, scrolls: 0};
+        const LABEL_ATTRIBUTES = ['aria-label', 'title', 'placeholder'];
+        new MutationObserver(records => {
+            watch.mutations++;
+            if (records.some(r => r.type !== 'attributes' || LABEL_ATTRIBUTES.includes(r.attributeName))) {
+                watch.texts++;
+            }
+        }).observe(document, {childList: true, subtree: true, characterData: true, attributes: true});
+        const relayout = () => { watch.layout++; };
+        window.addEventListener('resize', relayout, {passive: true});
+        window.addEventListener('load', relayout, {capture: true, passive: true});
+        if (window.ResizeObserver && document.body) {
+            new ResizeObserver(relayout).observe(document.body);
+        }
+        // Scroll events do not bubble; the capture listener sees those of
+        // inner containers too
+        window.addEventListener('scroll', () => { watch.scrolls++; }, {capture: true, passive: true});
+    }
+    return watch;
+}"""
+
+_CURSOR_MOVED_HELPER_JS = """function(moved, duration) {
+    // __moveAICursor__ returns a promise settling when the move finishes;
+    // cursors installed by older code return nothing. Either way a timer caps
+    // the wait: the promise is resolved from a requestAnimationFrame callback,
+    // and rAF does not run in background tabs (timers still do, throttled)
+    if (!moved || typeof moved.then !== 'function') {
+        return new Promise(r => setTimeout(r, 150));
+    }
+    const timeout = new Promise(r => setTimeout(r, Math.max(150, (duration || 0) + 100)));
+    return Promise.race([moved, timeout]);
+}"""
+
+# Click helper: element search strategies, visibility checks, cursor animation
+# and the click itself, called with {selector, showCursor, verbose}
+_CLICK_HELPER_JS = """async function(opts) {
+    const selector = opts.selector;
+
+    // Try multiple strategies to find the element
+    let el = null;
+    let strategy = '';
+
+    // SMART PATTERN: Close button detection
+    if (selector.toLowerCase().includes('close') ||
+        selector === '[close]' ||
+        selector === 'close-button') {
+
+        // Find typical close buttons (SVG icons, top-right position)
+        // The static NodeList is iterated directly, without copying it to an array
+        const candidates = document.querySelectorAll(
+            'button, [role="button"], [aria-label*="close" i], [aria-label*="dismiss" i], ' +
+            '.close, .dismiss, .modal-close, [class*="close"], [class*="dismiss"]'
+        );
+
+        // Score each candidate
+        let bestScore = 0;
+        let bestCandidate = null;
+
+        for (const btn of candidates) {
+            let score = 0;
+            const rect = btn.getBoundingClientRect();
+            const parent = btn.closest('dialog, [role="dialog"], .modal, .popup, [class*="modal"], [class*="dialog"]');
+
+            // Check if visible
+            if (rect.width === 0 || rect.height === 0) continue;
+
+            // +50: Has close-related class
+            // (includes() also covers exact 'close'/'dismiss' class names)
+            for (const c of btn.classList) {
+                if (c.includes('close') || c.includes('dismiss')) {
+                    score += 50;
+                    break;
+                }
+            }
+
+            // +30: Contains SVG (typical for icon-only buttons)
+            if (btn.querySelector('svg')) {
+                score += 30;
+            }
+
+            // +40: In top-right corner of parent
+            if (parent) {
+                const parentRect = parent.getBoundingClientRect();
+                const isTopRight = rect.right > (parentRect.right - 100) &&
+                                  rect.top < (parentRect.top + 100);
+                if (isTopRight) score += 40;
+            }
+
+            // +20: Small size (typical for close icons)
+            if (rect.width < 50 && rect.height < 50) {
+                score += 20;
+            }
+
+            // +30: Has aria-label with close/dismiss
+            const ariaLabel = btn.getAttribute('aria-label') || '';
+            if (ariaLabel.toLowerCase().includes('close') ||
+                ariaLabel.toLowerCase().includes('dismiss')) {
+                score += 30;
+            }
+
+            if (score > bestScore) {
+                bestScore = score;
+                bestCandidate = btn;
+            }
+        }
+
+        if (bestCandidate) {
+            el = bestCandidate;
+            strategy = 'smart-close-button (score: ' + bestScore + ')';
+        }
+    }
+
+    // Strategy 1: Direct CSS selector (XPath and free text may not parse as CSS)
+    if (!el) {
+        try {
+            el = document.querySelector(selector);
+        } catch (e) {}
+        if (el) strategy = 'css';
+    }
+
+    // Strategy 2: XPath
+    if (!el && selector.startsWith('//')) {
+        try {
+            const result = document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null);
+            el = result.singleNodeValue;
+            if (el) strategy = 'xpath';
+        } catch(e) {}
+    }
+
+    // Strategies 3 + 4: one pass over the clickable elements
+    //   3. quoted text from selectors like text="Save" (trimmed-equal or contained)
+    //   4. selector contained in text, aria-label or title
+    // Strategy 3 wins over an earlier strategy 4 match, as with separate passes
+    if (!el) {
+        let searchText = null;
+        if (selector.includes('text') || selector.includes('содержит')) {
+            const textMatch = selector.match(/["']([^"']+)["']/);
+            if (textMatch) searchText = textMatch[1];
+        }
+
+        let containsMatch = null;
+        const allClickable = document.querySelectorAll('button, a, [role="button"], [role="tab"], [onclick], input[type="button"], input[type="submit"]');
+        for (const e of allClickable) {
+            const text = e.textContent;
+            if (searchText !== null && (text.trim() === searchText || text.includes(searchText))) {
+                el = e;
+                strategy = 'text-exact';
+                break;
+            }
+            if (!containsMatch && (
+                text.includes(selector) ||
+                e.getAttribute('aria-label')?.includes(selector) ||
+                e.title?.includes(selector)
+            )) {
+                containsMatch = e;
+                if (searchText === null) break;
+            }
+        }
+        if (!el && containsMatch) {
+            el = containsMatch;
+            strategy = 'text-contains';
+        }
+    }
+
+    if (!el) {
+        // querySelector already found nothing, so the selector matches no elements
+        return {
+            success: false,
+            reason: 'not_found',
+            message: 'Element not found: ' + selector,
+            matchCount: 0,
+            suggestion: 'Try using text content or XPath'
+        };
+    }
+
+    // Check visibility. checkVisibility() (Chrome 105+) answers natively and
+    // also covers hidden ancestors and content-visibility; the computed
+    // style is then only resolved to describe a failure
+    let rect = el.getBoundingClientRect();
+    let style = null;
+    let isVisible = rect.width > 0 && rect.height > 0;
+    if (isVisible && el.checkVisibility) {
+        isVisible = el.checkVisibility({opacityProperty: true, visibilityProperty: true, contentVisibilityAuto: true});
+    } else if (isVisible) {
+        style = window.getComputedStyle(el);
+        isVisible = style.display !== 'none' &&
+                    style.visibility !== 'hidden' &&
+                    parseFloat(style.opacity) > 0;  // FIXED (v3.0.1): numeric comparison
+    }
+
+    if (!isVisible) {
+        style = style || window.getComputedStyle(el);
+        return {
+            success: false,
+            reason: 'not_visible',
+            message: 'Element found but not visible',
+            display: style.display,
+            visibility: style.visibility,
+            opacity: style.opacity,
+            dimensions: { width: rect.width, height: rect.height }
+        };
+    }
+
+    // Check viewport
+    const inViewport = rect.top >= 0 && rect.left >= 0 &&
+                      rect.bottom <= window.innerHeight &&
+                      rect.right <= window.innerWidth;
+
+    // Scroll into view if needed. Without the cursor nothing is shown, so the
+    // scroll is instant and there is nothing to wait for
+    const showCursor = opts.showCursor;
+    const verbose = opts.verbose;
+    if (!inViewport) {
+        el.scrollIntoView({ behavior: showCursor ? 'smooth' : 'instant', block: 'center', inline: 'center' });
+        if (showCursor) await this.wait_in_view(el, 400);
+        // DOMRect top/left are read-only: re-measure instead of patching them
+        rect = el.getBoundingClientRect();
+    }
+
+    // Calculate click position
+    const clickX = rect.left + rect.width / 2;
+    const clickY = rect.top + rect.height / 2;
+
+    // Animate cursor and wait for completion
+    if (showCursor && window.__moveAICursor__) {
+        await this.cursor_moved(window.__moveAICursor__(clickX, clickY, 400), 400);
+    }
+
+    // Show click animation and wait
+    if (showCursor && window.__clickAICursor__) {
+        window.__clickAICursor__();
+        await new Promise(r => setTimeout(r, 400)); // Wait for click flash
+    }
+
+    const clicked = this.press_and_click(el, clickX, clickY);
+
+    const result = {
+        success: clicked,
+        selector: selector,
+        strategy: strategy,
+        message: clicked ? 'Clicked element using strategy: ' + strategy : 'All click methods failed',
+        cursorAnimated: showCursor,
+        cursorVisible: window.__aiCursor__ && window.__aiCursor__.style.display !== 'none'
+    };
+    // Element details are only sent for a successful click
+    if (clicked) {
+        result.elementInfo = verbose ? {
+            tagName: el.tagName,
+            strategy: strategy,
+            id: el.id,
+            className: el.className,
+            text: this.slice_trim(el.textContent, 100),
+            position: {
+                top: rect.top,
+                left: rect.left,
+                width: rect.width,
+                height: rect.height,
+                clickX: clickX,
+                clickY: clickY
+            },
+            inViewport: inViewport
+        } : { tagName: el.tagName, strategy: strategy };
+    }
+    return result;
+}"""
+
+# Click-by-text helper: collects clickable candidates, scores them against the
+# search text, then scrolls, animates the cursor and clicks the best match.
+# Called with {text, tags, fallbackTags, exact, verbose}
+_CLICK_BY_TEXT_HELPER_JS = """async function(opts) {
+    // Per-call memo: computed style and visibility rect are each read at most
+    // once per element, however often the loops below revisit it
+    const styleCache = new Map();
+    const rectCache = new Map();
+    function styleOf(el) {
+        let style = styleCache.get(el);
+        if (style === undefined) {
+            style = window.getComputedStyle(el);
+            styleCache.set(el, style);
+        }
+        return style;
+    }
+
+    // Check for ANY interactive cursor type (not just pointer!)
+    // Supports: pointer, move, grab, grabbing, zoom-in, zoom-out, all-scroll
+    const interactiveCursors = new Set(['pointer', 'move', 'grab', 'grabbing', 'zoom-in', 'zoom-out', 'all-scroll']);
+
+    const searchText = opts.text;
+    const exactMatch = opts.exact;
+
+    // Normalize text function - removes extra whitespace and normalizes
+    // Same result as text.replace(/\\s+/g, ' ').trim().toLowerCase(), in one
+    // scan: non-space runs are copied as slices (not char by char), joined by
+    // single spaces, and the result is lowercased natively in one go.
+    // Non-ASCII chars are only range-checked against the rest of the \\s set
+    function isSpace(c) {
+        if (c < 128) return c === 32 || (c >= 9 && c <= 13);
+        return c === 0xa0 || c === 0x1680 || (c >= 0x2000 && c <= 0x200a) ||
+               c === 0x2028 || c === 0x2029 || c === 0x202f || c === 0x205f ||
+               c === 0x3000 || c === 0xfeff;
+    }
+
+    function normalizeText(text) {
+        if (!text) return '';
+        let out = '';
+        let start = -1;  // start of the current non-space run
+        for (let i = 0; i < text.length; i++) {
+            if (isSpace(text.charCodeAt(i))) {
+                if (start >= 0) {
+                    out += (out ? ' ' : '') + text.slice(start, i);
+                    start = -1;
+                }
+            } else if (start < 0) {
+                start = i;
+            }
+        }
+        if (start >= 0) out += (out ? ' ' : '') + text.slice(start);
+        return out.toLowerCase();
+    }
+
+    // Not hidden by display, visibility, opacity or content-visibility:
+    // checkVisibility() (Chrome 105+) does this natively without resolving
+    // the computed style, and also looks at ancestors
+    const VISIBILITY_OPTIONS = {opacityProperty: true, visibilityProperty: true, contentVisibilityAuto: true};
+    function isRendered(el) {
+        if (el.checkVisibility) return el.checkVisibility(VISIBILITY_OPTIONS);
+        const style = styleOf(el);
+        return style.display !== 'none' &&
+               style.visibility !== 'hidden' &&
+               parseFloat(style.opacity) > 0;  // FIXED (v3.0.1): numeric comparison
+    }
+
+    // Bounding rect of a truly visible and clickable element, null otherwise
+    function visibleRect(el) {
+        let rect = rectCache.get(el);
+        if (rect !== undefined) return rect;
+
+        rect = el.getBoundingClientRect();
+        const visible = rect.width > 0 &&
+               rect.height > 0 &&
+               el.offsetParent !== null &&
+               isRendered(el);
+        if (!visible) rect = null;
+        rectCache.set(el, rect);
+        return rect;
+    }
+
+    function isElementVisible(el) {
+        return visibleRect(el) !== null;
+    }
+
+    // Persisted across calls on the helpers object (this), invalidated through
+    // the shared watcher (dom_watch):
+    //  - texts: normalized texts, keyed weakly by element, dropped wholesale on
+    //    any text or label mutation. The value property is not covered: typing
+    //    changes it without a mutation
+    //  - best: the last winners per search (LRU, BEST_LIMIT entries), dropped on
+    //    any mutation, scroll or layout change, since scores depend on layout too
+    const helpers = this;
+    const BEST_LIMIT = 50;
+    function textState() {
+        const watch = helpers.dom_watch();
+        let state = helpers.__textState__;
+        if (!state) {
+            state = helpers.__textState__ = {texts: new WeakMap(), textsKey: null, best: new Map(), bestKey: null};
+        }
+        if (state.textsKey !== watch.texts) {
+            state.texts = new WeakMap();
+            state.textsKey = watch.texts;
+        }
+        const bestKey = watch.mutations + ':' + watch.scrolls + ':' + watch.layout;
+        if (state.bestKey !== bestKey) {
+            state.best.clear();
+            state.bestKey = bestKey;
+        }
+        return state;
+    }
+
+    function textsOf(el) {
+        const cache = textState().texts;
+        let texts = cache.get(el);
+        if (texts === undefined) {
+            texts = {
+                full: normalizeText(el.textContent || ''),
+                direct: normalizeText(getDirectText(el)),
+                aria: normalizeText(el.getAttribute('aria-label') || ''),
+                title: normalizeText(el.title || ''),
+                placeholder: normalizeText(el.placeholder || '')
+            };
+            cache.set(el, texts);
+        }
+        return texts;
+    }
+
+    // Get direct text content (without nested elements)
+    function getDirectText(el) {
+        let text = '';
+        for (let node of el.childNodes) {
+            if (node.nodeType === Node.TEXT_NODE) {
+                text += node.textContent;
+            }
+        }
+        return text.trim();
+    }
+
+    // Find best matching element
+    const searchNorm = normalizeText(searchText);
+    let bestMatch = null;
+    let bestScore = 0;
+
+    // Get viewport dimensions for scoring (v3.0.0)
+    const viewportWidth = window.innerWidth;
+    const viewportHeight = window.innerHeight;
+
+    // Highest reachable score: text score (exact 100+50, partial 50+30+10)
+    // plus viewport (+15), center (+10) and near-top (+5) bonuses
+    const maxScore = exactMatch ? 180 : 120;
+
+    // Scores candidates, keeping the best so far; true once the top score is
+    // reached, as nothing scored afterwards could beat it
+    function scoreCandidates(list) {
+        for (const el of list) {
+            // Element position for viewport scoring (null if not visible)
+            const rect = visibleRect(el);
+            if (!rect) continue;
+
+            // Get various text representations
+            const texts = textsOf(el);
+            const fullText = texts.full;
+            const directText = texts.direct;
+            const ariaLabel = texts.aria;
+            const title = texts.title;
+            const value = normalizeText(el.value || '');
+            const placeholder = texts.placeholder;
+
+            let score = 0;
+            let matched = false;
+
+            if (exactMatch) {
+                // Exact match mode
+                if (fullText === searchNorm || directText === searchNorm ||
+                    ariaLabel === searchNorm || title === searchNorm ||
+                    value === searchNorm || placeholder === searchNorm) {
+                    matched = true;
+                    score = 100;
+                    // Prefer elements with less nested content
+                    if (directText === searchNorm) score += 50;
+                }
+            } else {
+                // Partial match mode
+                if (fullText.includes(searchNorm)) {
+                    matched = true;
+                    score = 50;
+                    // Prefer direct text match
+                    if (directText.includes(searchNorm)) score += 30;
+                    // Prefer shorter text (more specific)
+                    if (fullText.length < 100) score += 10;
+                }
+                if (ariaLabel.includes(searchNorm)) {
+                    matched = true;
+                    score = Math.max(score, 70);
+                }
+                if (title.includes(searchNorm)) {
+                    matched = true;
+                    score = Math.max(score, 60);
+                }
+                if (value.includes(searchNorm)) {
+                    matched = true;
+                    score = Math.max(score, 80);
+                }
+                if (placeholder.includes(searchNorm)) {
+                    matched = true;
+                    score = Math.max(score, 40);
+                }
+            }
+
+            // VIEWPORT SCORING (v3.0.0): Prefer elements in viewport and center
+            if (matched) {
+                // Bonus for element in viewport (+15 points)
+                const inViewport = rect.top >= 0 && rect.left >= 0 &&
+                                  rect.bottom <= viewportHeight &&
+                                  rect.right <= viewportWidth;
+                if (inViewport) {
+                    score += 15;
+
+                    // Additional bonus for center zone (20-80% of viewport) (+10 points)
+                    const centerMinX = viewportWidth * 0.2;
+                    const centerMaxX = viewportWidth * 0.8;
+                    const centerMinY = viewportHeight * 0.2;
+                    const centerMaxY = viewportHeight * 0.8;
+
+                    const elCenterX = rect.left + rect.width / 2;
+                    const elCenterY = rect.top + rect.height / 2;
+
+                    if (elCenterX >= centerMinX && elCenterX <= centerMaxX &&
+                        elCenterY >= centerMinY && elCenterY <= centerMaxY) {
+                        score += 10;
+                    }
+                } else {
+                    // Penalty for elements outside viewport (-5 points)
+                    score -= 5;
+                }
+
+                // Bonus for elements near top (first 500px) - likely more important (+5 points)
+                if (rect.top >= 0 && rect.top < 500) {
+                    score += 5;
+                }
+            }
+
+            if (matched && score > bestScore) {
+                bestScore = score;
+                bestMatch = el;
+                // Nothing later can beat the top score (ties keep the earlier element)
+                if (bestScore >= maxScore) return true;
+            }
+        }
+        return false;
+    }
+
+    // Candidates come in tiers, cheapest and most precise first: the semantic
+    // tags, then (only if those did not reach the top score) the low-precision
+    // fallback tags and the computed-style scan below. Each element is scored
+    // once; on equal scores an earlier tier wins
+    const candidates = new Set();
+    function collect(selector, into) {
+        for (const el of document.querySelectorAll(selector)) {
+            if (!candidates.has(el)) {
+                candidates.add(el);
+                into.push(el);
+            }
+        }
+        return into;
+    }
+
+    const semanticTags = opts.tags;
+    const fallbackTags = opts.fallbackTags || [];
+
+    // Same search with nothing changed since: reuse its winner, unscored.
+    // Otherwise 1. score the semantic clickable elements
+    const best = textState().best;
+    const bestKey = JSON.stringify([searchNorm, exactMatch, semanticTags, fallbackTags]);
+    const remembered = best.get(bestKey);
+    if (remembered && remembered.el.isConnected && visibleRect(remembered.el)) {
+        bestMatch = remembered.el;
+        bestScore = remembered.score;
+        best.delete(bestKey);  // re-added below as most recently used
+    } else if (!scoreCandidates(collect(semanticTags.join(', '), []))) {
+        const more = fallbackTags.length ? collect(fallbackTags.join(', '), []) : [];
+
+        // 2. FIXED (v3.0.1): Find visually clickable elements via getComputedStyle
+        // Previous v3.0.0 used CSS selector optimization that BROKE React/Vue apps
+        // CSS selector only finds inline styles, misses CSS class-based cursors
+        // This is the correct approach used by save_page_info
+        for (const el of document.querySelectorAll('div, span, li, section, article, header')) {
+            if (candidates.has(el)) continue;
+            const style = styleOf(el);
+            const hasInteractiveCursor = interactiveCursors.has(style.cursor);
+
+            // Check onclick PROPERTY (not attribute) - catches React event delegation
+            const hasOnclick = el.onclick !== null;
+
+            if (hasInteractiveCursor || hasOnclick) {
+                candidates.add(el);
+                more.push(el);
+            }
+        }
+        scoreCandidates(more);
+    }
+    if (bestMatch) {
+        best.set(bestKey, {el: bestMatch, score: bestScore});
+        if (best.size > BEST_LIMIT) best.delete(best.keys().next().value);
+    }
+
+    const elements = [...candidates];
+
+    const el = bestMatch;
+
+    if (!el) {
+        // Better debug information
+        const visibleElements = elements.filter(isElementVisible);
+        const partialMatches = visibleElements.filter(e => {
+            const text = textsOf(e).full;
+            return text.includes(searchNorm) || searchNorm.includes(text);
+        });
+
+        return {
+            success: false,
+            message: `Element with text not found: "${searchText}"`,
+            searchedTags: semanticTags.concat(fallbackTags),
+            totalElements: elements.length,
+            visibleElements: visibleElements.length,
+            partialMatches: partialMatches.length,
+            availableTexts: opts.verbose ? visibleElements.slice(0, 15).map(e => ({
+                tag: e.tagName,
+                text: this.slice_trim(e.textContent, 60),
+                ariaLabel: e.getAttribute('aria-label'),
+                role: e.getAttribute('role')
+            })) : undefined,
+            suggestion: opts.verbose ? undefined : 'Retry with verbose=true to list available texts'
+        };
+    }
+
+    // Scroll into view if needed (rect measured during scoring, nothing has run since)
+    const rect = visibleRect(el);
+    let clickX = Math.round(rect.left + rect.width / 2);
+    let clickY = Math.round(rect.top + rect.height / 2);
+
+    const inViewport = rect.top >= 0 && rect.left >= 0 &&
+                      rect.bottom <= window.innerHeight &&
+                      rect.right <= window.innerWidth;
+
+    if (!inViewport) {
+        el.scrollIntoView({ behavior: 'smooth', block: 'center', inline: 'center' });
+        await this.wait_in_view(el, 400);
+        // Recalculate after scroll
+        const newRect = el.getBoundingClientRect();
+        clickX = Math.round(newRect.left + newRect.width / 2);
+        clickY = Math.round(newRect.top + newRect.height / 2);
+    }
+
+    // Debug logging
+    console.log('[MCP] Click target:', {
+        searchText: searchText,
+        foundText: this.slice_trim(el.textContent, 100),
+        tag: el.tagName,
+        score: bestScore,
+        coords: { x: clickX, y: clickY },
+        rect: { left: rect.left, top: rect.top, width: rect.width, height: rect.height }
+    });
+
+    // Animate cursor and wait for completion (v3.0.0: reduced to 200ms)
+    if (window.__moveAICursor__) {
+        await this.cursor_moved(window.__moveAICursor__(clickX, clickY, 200), 200);
+    }
+
+    // Show click animation and wait (v3.0.0: reduced to 200ms)
+    if (window.__clickAICursor__) {
+        window.__clickAICursor__();
+        await new Promise(r => setTimeout(r, 200)); // Wait for click flash
+    }
+
+    // Now perform the actual click
+    const clicked = this.press_and_click(el, clickX, clickY);
+
+    const result = {
+        success: clicked,
+        searchText: searchText,
+        matchScore: bestScore,
+        message: clicked ? `Clicked element with text: "${searchText}"` : 'All click methods failed',
+        cursorVisible: window.__aiCursor__ && window.__aiCursor__.style.display !== 'none'
+    };
+    // Element details are only sent for a successful click
+    if (clicked) {
+        result.element = opts.verbose ? {
+            tag: el.tagName,
+            id: el.id,
+            className: el.className,
+            actualText: this.slice_trim(el.textContent, 100),
+            ariaLabel: el.getAttribute('aria-label'),
+            role: el.getAttribute('role'),
+            position: { x: clickX, y: clickY }
+        } : {
+            tag: el.tagName,
+            position: { x: clickX, y: clickY }
+        };
+    }
+    return result;
+}"""
+
+# Semantic clickable elements searched by click_by_text when no tag is given.
+# Built once at import and shared by every call, hence immutable.
+# The precise tags are scored first; the broad fallback tags (and the
+# computed-style scan) only if none of those reached the top score
+_SEMANTIC_CLICK_TAGS = (
+    'button', 'a', 'input[type="button"]', 'input[type="submit"]',
+    '[role="button"]', '[role="tab"]', '[role="link"]', '[role="menuitem"]'
+)
+_FALLBACK_CLICK_TAGS = ('[onclick]', '.btn', '.button', '[tabindex]')
+
+# Direction lookups for scroll_page (the scroll expressions themselves live in the helper)
+_RELATIVE_SCROLL_DIRECTIONS = frozenset(("down", "up", "left", "right"))
+_SCROLL_DIRECTIONS = _RELATIVE_SCROLL_DIRECTIONS | {"top", "bottom"}
+
+# How long a cached "at the edge of the page" result is trusted (seconds)
+_SCROLL_EDGE_TTL = 1.0
+
+# How long a measured element rect is reused by move_cursor (seconds)
+_RECT_CACHE_TTL = 2.0
+
+# Cursor moves shorter than this (|dx| + |dy|, CSS pixels) are not sent: the
+# overlay would not visibly move
+_CURSOR_MOVE_THRESHOLD = 2
+
+AsyncCDP.register_helper("scroll", _SCROLL_HELPER_JS)
+AsyncCDP.register_helper("move", _MOVE_HELPER_JS)
+AsyncCDP.register_helper("wait_in_view", _WAIT_IN_VIEW_HELPER_JS)
+AsyncCDP.register_helper("cursor_moved", _CURSOR_MOVED_HELPER_JS)
+AsyncCDP.register_helper("dom_watch", _DOM_WATCH_HELPER_JS)
+AsyncCDP.register_helper("slice_trim", _SLICE_TRIM_HELPER_JS)
+AsyncCDP.register_helper("press_and_click", _PRESS_AND_CLICK_HELPER_JS)
+AsyncCDP.register_helper("click", _CLICK_HELPER_JS, returns_promise=True)
+AsyncCDP.register_helper("click_by_text", _CLICK_BY_TEXT_HELPER_JS, returns_promise=True)
+
+
+def _int_in_range(value: Any, min_value: int, max_value: int) -> bool:
+    """Fast-path check for optional int arguments
+
+    Args:
+        value: Argument value (None means "not provided")
+        min_value: Minimum allowed value (inclusive)
+        max_value: Maximum allowed value (inclusive)
+
+    Returns:
+        True if value is None or a plain int within range; anything else
+        should go through Validators for coercion and error reporting
+    """
+    return value is None or (type(value) is int and min_value <= value <= max_value)
+
+
+def _scroll_is_noop(direction: str, cached: Dict[str, Any]) -> bool:
+    """Check whether a page scroll cannot move from a known position
+
+    The user or the page's own scripts may scroll between calls, so the cached
+    position is only trusted for _SCROLL_EDGE_TTL seconds, for every edge.
+
+    Args:
+        direction: Scroll direction
+        cached: page_state entry with the last helper "position", the
+            "direction" it was produced by and its monotonic "time"
+
+    Returns:
+        True if the page is already at the edge the scroll would move towards
+    """
+    if time.monotonic() - cached["time"] > _SCROLL_EDGE_TTL:
+        return False
+
+    position = cached["position"]
+    x, y = position.get("x"), position.get("y")
+    if x is None or y is None:
+        return False
+    if direction == "up":
+        return y <= 0
+    if direction == "left":
+        return x <= 0
+    if direction == "top":
+        return x <= 0 and y <= 0
+
+    def at_end(axis: str, directions: tuple) -> bool:
+        limit = position.get("maxY" if axis == "y" else "maxX")
+        if limit is not None:
+            return position[axis] >= limit
+        return cached["direction"] in directions and bool(position.get("limited"))
+
+    if direction == "down":
+        return at_end("y", ("down", "bottom"))
+    if direction == "right":
+        return at_end("x", ("right",))
+    if direction == "bottom":
+        return x <= 0 and at_end("y", ("down", "bottom"))
+    return False
+
 
 @register
 class ClickCommand(Command):
     """Click on an element with multiple search strategies"""
 
+    __slots__ = ()
+
     name = "click"
     description = """Click on an element. Supports multiple strategies including smart UI patterns.
 
@@ -30,7 +1042,8 @@ Auto-scrolls to element and shows cursor animation."""
     input_schema = {
         "type": "object",
         "properties": {
-            "selector": {"type": "string", "description": "CSS selector, XPath, text, or smart pattern like 'close'"}
+            "selector": {"type": "string", "description": "CSS selector, XPath, text, or smart pattern like 'close'"},
+            "verbose": {"type": "boolean", "description": "Include id, className, text and position in elementInfo", "default": False}
         },
         "required": ["selector"]
     }
@@ -38,250 +1051,38 @@ Auto-scrolls to element and shows cursor animation."""
     requires_cursor = True
     requires_cdp = True  # Uses AsyncCDP wrapper for thread-safe evaluation
 
-    async def execute(self, selector: str, show_cursor: bool = True, **kwargs) -> Dict[str, Any]:
-        """Execute click with multiple strategies and cursor animation"""
+    async def execute(self, selector: str, show_cursor: bool = True, verbose: bool = False,
+                      **kwargs) -> Dict[str, Any]:
+        """Execute click with multiple strategies and cursor animation
+
+        elementInfo is only returned for a successful click, with just
+        tagName and strategy unless verbose=True.
+        """
         try:
-            # Validate selector
-            selector = Validators.validate_selector(selector, "selector", allow_xpath=True)
+            # Validate selector (passed to the page helper by value)
+            selector = Validators.validate_selector(selector, "selector", allow_xpath=True, sanitize=False)
 
-            # Always initialize and show cursor
+            # The cursor overlay is only needed when it is shown
             cursor = self.context.cursor
-            if cursor:
+            if show_cursor and cursor:
                 await cursor.initialize()
 
             logger.debug(f"click: targeting selector '{selector}' (show_cursor={show_cursor})")
 
-            js_code = f"""
-            (async function() {{
-                // Try multiple strategies to find the element
-                let el = null;
-                let strategy = '';
-
-                // SMART PATTERN: Close button detection
-                if ('{selector}'.toLowerCase().includes('close') ||
-                    '{selector}' === '[close]' ||
-                    '{selector}' === 'close-button') {{
-
-                    // Find typical close buttons (SVG icons, top-right position)
-                    const candidates = Array.from(document.querySelectorAll(
-                        'button, [role="button"], [aria-label*="close" i], [aria-label*="dismiss" i], ' +
-                        '.close, .dismiss, .modal-close, [class*="close"], [class*="dismiss"]'
-                    ));
-
-                    // Score each candidate
-                    let bestScore = 0;
-                    let bestCandidate = null;
-
-                    for (const btn of candidates) {{
-                        let score = 0;
-                        const rect = btn.getBoundingClientRect();
-                        const parent = btn.closest('dialog, [role="dialog"], .modal, .popup, [class*="modal"], [class*="dialog"]');
-
-                        // Check if visible
-                        if (rect.width === 0 || rect.height === 0) continue;
-
-                        // +50: Has close-related class
-                        if (btn.classList.contains('close') ||
-                            btn.classList.contains('dismiss') ||
-                            Array.from(btn.classList).some(c => c.includes('close') || c.includes('dismiss'))) {{
-                            score += 50;
-                        }}
-
-                        // +30: Contains SVG (typical for icon-only buttons)
-                        if (btn.querySelector('svg')) {{
-                            score += 30;
-                        }}
-
-                        // +40: In top-right corner of parent
-                        if (parent) {{
-                            const parentRect = parent.getBoundingClientRect();
-                            const isTopRight = rect.right > (parentRect.right - 100) &&
-                                              rect.top < (parentRect.top + 100);
-                            if (isTopRight) score += 40;
-                        }}
-
-                        // +20: Small size (typical for close icons)
-                        if (rect.width < 50 && rect.height < 50) {{
-                            score += 20;
-                        }}
-
-                        // +30: Has aria-label with close/dismiss
-                        const ariaLabel = btn.getAttribute('aria-label') || '';
-                        if (ariaLabel.toLowerCase().includes('close') ||
-                            ariaLabel.toLowerCase().includes('dismiss')) {{
-                            score += 30;
-                        }}
-
-                        if (score > bestScore) {{
-                            bestScore = score;
-                            bestCandidate = btn;
-                        }}
-                    }}
-
-                    if (bestCandidate) {{
-                        el = bestCandidate;
-                        strategy = 'smart-close-button (score: ' + bestScore + ')';
-                    }}
-                }}
-
-                // Strategy 1: Direct CSS selector
-                if (!el) {{
-                    el = document.querySelector('{selector}');
-                    if (el) strategy = 'css';
-                }}
-
-                // Strategy 2: XPath
-                if (!el && '{selector}'.startsWith('//')) {{
-                    try {{
-                        const result = document.evaluate('{selector}', document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null);
-                        el = result.singleNodeValue;
-                        if (el) strategy = 'xpath';
-                    }} catch(e) {{}}
-                }}
-
-                // Strategy 3: Text content search
-                if (!el && ('{selector}'.includes('text') || '{selector}'.includes('содержит'))) {{
-                    const textMatch = '{selector}'.match(/["']([^"']+)["']/);
-                    if (textMatch) {{
-                        const searchText = textMatch[1];
-                        el = Array.from(document.querySelectorAll('button, a, [role="button"], [role="tab"], [onclick]'))
-                            .find(e => e.textContent.trim() === searchText || e.textContent.includes(searchText));
-                        if (el) strategy = 'text-exact';
-                    }}
-                }}
-
-                // Strategy 4: Common clickable patterns
-                if (!el) {{
-                    const allClickable = document.querySelectorAll('button, a, [role="button"], [role="tab"], [onclick], input[type="button"], input[type="submit"]');
-                    el = Array.from(allClickable).find(e =>
-                        e.textContent.includes('{selector}') ||
-                        e.getAttribute('aria-label')?.includes('{selector}') ||
-                        e.title?.includes('{selector}')
-                    );
-                    if (el) strategy = 'text-contains';
-                }}
-
-                if (!el) {{
-                    const allMatches = document.querySelectorAll('{selector}');
-                    return {{
-                        success: false,
-                        reason: 'not_found',
-                        message: 'Element not found: {selector}',
-                        matchCount: allMatches.length,
-                        suggestion: allMatches.length > 0 ? 'Selector matches ' + allMatches.length + ' elements' : 'Try using text content or XPath'
-                    }};
-                }}
-
-                // Check visibility
-                const rect = el.getBoundingClientRect();
-                const style = window.getComputedStyle(el);
-                const isVisible = rect.width > 0 && rect.height > 0 &&
-                                 style.display !== 'none' &&
-                                 style.visibility !== 'hidden' &&
-                                 parseFloat(style.opacity) > 0;  // FIXED (v3.0.1): numeric comparison
-
-                if (!isVisible) {{
-                    return {{
-                        success: false,
-                        reason: 'not_visible',
-                        message: 'Element found but not visible',
-                        display: style.display,
-                        visibility: style.visibility,
-                        opacity: style.opacity,
-                        dimensions: {{ width: rect.width, height: rect.height }}
-                    }};
-                }}
-
-                // Check viewport
-                const inViewport = rect.top >= 0 && rect.left >= 0 &&
-                                  rect.bottom <= window.innerHeight &&
-                                  rect.right <= window.innerWidth;
-
-                // Scroll into view if needed
-                if (!inViewport) {{
-                    el.scrollIntoView({{ behavior: 'smooth', block: 'center', inline: 'center' }});
-                    await new Promise(r => setTimeout(r, 300));
-                    const newRect = el.getBoundingClientRect();
-                    rect.top = newRect.top;
-                    rect.left = newRect.left;
-                }}
-
-                // Calculate click position
-                const clickX = rect.left + rect.width / 2;
-                const clickY = rect.top + rect.height / 2;
-
-                // Animate cursor and wait for completion
-                const showCursor = {str(show_cursor).lower()};
-                if (showCursor && window.__moveAICursor__) {{
-                    window.__moveAICursor__(clickX, clickY, 400);
-                    await new Promise(r => setTimeout(r, 400)); // Wait for cursor animation
-                }}
-
-                // Show click animation and wait
-                if (showCursor && window.__clickAICursor__) {{
-                    window.__clickAICursor__();
-                    await new Promise(r => setTimeout(r, 400)); // Wait for click flash
-                }}
-
-                // Multiple click methods
-                el.click();
-
-                ['mousedown', 'mouseup', 'click'].forEach(eventType => {{
-                    const event = new MouseEvent(eventType, {{
-                        view: window,
-                        bubbles: true,
-                        cancelable: true,
-                        clientX: clickX,
-                        clientY: clickY
-                    }});
-                    el.dispatchEvent(event);
-                }});
-
-                if (el.tagName === 'BUTTON' || el.tagName === 'INPUT' || el.tagName === 'A') {{
-                    try {{
-                        el.focus();
-                        if (el.onclick) el.onclick.call(el);
-                    }} catch (e3) {{}}
-                }}
-
-                return {{
-                    success: true,
-                    selector: '{selector}',
-                    strategy: strategy,
-                    message: 'Clicked element using strategy: ' + strategy,
-                    cursorAnimated: showCursor,
-                    cursorVisible: window.__aiCursor__ && window.__aiCursor__.style.display !== 'none',
-                    elementInfo: {{
-                        tagName: el.tagName,
-                        id: el.id,
-                        className: el.className,
-                        text: el.textContent.trim().substring(0, 100),
-                        position: {{
-                            top: rect.top,
-                            left: rect.left,
-                            width: rect.width,
-                            height: rect.height,
-                            clickX: clickX,
-                            clickY: clickY
-                        }},
-                        inViewport: inViewport
-                    }}
-                }};
-            }})()
-            """
-
-            # Use AsyncCDP wrapper for thread-safe evaluation (STABILITY FIX)
-            result = await self.context.cdp.evaluate(expression=js_code, returnByValue=True, awaitPromise=True)
-            click_result = result.get('result', {}).get('value')
+            # Preloaded helper: no script parse per click, arguments passed by value
+            click_result = await self.context.cdp.call_helper(
+                "click",
+                {"selector": selector, "showCursor": show_cursor, "verbose": verbose}
+            )
 
             # Handle None or missing value
             if not click_result or not isinstance(click_result, dict):
-                logger.error(f"✗ Invalid click result: {result}")
+                logger.error(f"✗ Invalid click result: {click_result}")
                 return {
                     "success": False,
                     "reason": "invalid_result",
                     "message": f"Click returned invalid result for selector: {selector}",
-                    "raw_result": str(result)
+                    "raw_result": str(click_result)
                 }
 
             # Log result for debugging
@@ -308,6 +1109,8 @@ Auto-scrolls to element and shows cursor animation."""
 class ClickByTextCommand(Command):
     """Click element by visible text content"""
 
+    __slots__ = ()
+
     name = "click_by_text"
     description = """Click element by text. Auto-finds coordinates, moves cursor, clicks. Returns success/failure.
 
@@ -318,7 +1121,8 @@ Tip: Use save_page_info() first to see available elements and verify click worke
         "properties": {
             "text": {"type": "string", "description": "Text to search for"},
             "tag": {"type": "string", "description": "Optional: limit search to specific tag"},
-            "exact": {"type": "boolean", "description": "If true, match exact text", "default": False}
+            "exact": {"type": "boolean", "description": "If true, match exact text", "default": False},
+            "verbose": {"type": "boolean", "description": "Include id, className, text and role of the clicked element, or the available texts when nothing matched", "default": False}
         },
         "required": ["text"]
     }
@@ -326,8 +1130,14 @@ Tip: Use save_page_info() first to see available elements and verify click worke
     requires_cursor = True
     requires_cdp = True  # Uses AsyncCDP wrapper for thread-safe evaluation
 
-    async def execute(self, text: str, tag: Optional[str] = None, exact: bool = False, **kwargs) -> Dict[str, Any]:
-        """Execute click by text with cursor animation (v3.0.0: with TTL cache)"""
+    async def execute(self, text: str, tag: Optional[str] = None, exact: bool = False,
+                      verbose: bool = False, **kwargs) -> Dict[str, Any]:
+        """Execute click by text with cursor animation (v3.0.0: with TTL cache)
+
+        The element is only returned for a successful click, with just its
+        tag and click position unless verbose=True; failures carry no
+        availableTexts unless verbose=True.
+        """
         try:
             # Validate text
             text = Validators.validate_string_length(text, "text", min_length=1, max_length=500)
@@ -338,7 +1148,7 @@ Tip: Use save_page_info() first to see available elements and verify click worke
 
             # Check cache (v3.0.0: TTL cache for repeated clicks)
             cache = get_element_search_cache()
-            cache_key = f"click_by_text:{current_url}:{text}:{exact}:{tag}"
+            cache_key = f"click_by_text:{current_url}:{text}:{exact}:{tag}:{verbose}"
 
             cached_result = cache.get(cache_key)
             if cached_result:
@@ -349,7 +1159,10 @@ Tip: Use save_page_info() first to see available elements and verify click worke
                     await cursor.initialize()
                     element_pos = cached_result.get('element', {}).get('position', {})
                     if element_pos:
-                        await cursor.move(element_pos.get('x', 0), element_pos.get('y', 0), duration=200)
+                        # Preloaded move helper: coordinates passed by value, no per-call script
+                        await self.context.cdp.call_helper(
+                            "move", {"x": element_pos.get('x', 0), "y": element_pos.get('y', 0), "duration": 200}
+                        )
                         await cursor.click_animation()
                         await asyncio.sleep(0.2)  # Wait for animation
 
@@ -362,346 +1175,35 @@ Tip: Use save_page_info() first to see available elements and verify click worke
 
             logger.debug(f"click_by_text: searching for '{text}' (exact={exact}, tag={tag})")
 
-            # Escape special characters for JavaScript
-            import json
-            text_escaped = json.dumps(text)
-
-            if tag:
-                tags_js = json.dumps([tag])
-            else:
-                # Start with semantic clickable elements
-                tags_js = json.dumps([
-                    'button', 'a', 'input[type="button"]', 'input[type="submit"]',
-                    '[role="button"]', '[role="tab"]', '[role="link"]', '[role="menuitem"]',
-                    '[onclick]', '.btn', '.button', '[tabindex]'
-                ])
-
-            js_code = f"""
-            (async function() {{
-                let elements = [];
-
-                // 1. Get semantic clickable elements
-                const semanticTags = {tags_js};
-                const semanticSelector = semanticTags.join(', ');
-                const semanticElements = Array.from(document.querySelectorAll(semanticSelector));
-                elements.push(...semanticElements);
-
-                // 2. FIXED (v3.0.1): Find visually clickable elements via getComputedStyle
-                // Previous v3.0.0 used CSS selector optimization that BROKE React/Vue apps
-                // CSS selector only finds inline styles, misses CSS class-based cursors
-                // This is the correct approach used by save_page_info
-                const potentialClickable = Array.from(document.querySelectorAll('div, span, li, section, article, header'));
-
-                for (const el of potentialClickable) {{
-                    const style = window.getComputedStyle(el);
-
-                    // Check for ANY interactive cursor type (not just pointer!)
-                    // Supports: pointer, move, grab, grabbing, zoom-in, zoom-out, all-scroll
-                    const interactiveCursors = ['pointer', 'move', 'grab', 'grabbing', 'zoom-in', 'zoom-out', 'all-scroll'];
-                    const hasInteractiveCursor = interactiveCursors.includes(style.cursor);
-
-                    // Check onclick PROPERTY (not attribute) - catches React event delegation
-                    const hasOnclick = el.onclick !== null;
-
-                    if (hasInteractiveCursor || hasOnclick) {{
-                        elements.push(el);
-                    }}
-                }}
-
-                // Remove duplicates
-                elements = [...new Set(elements)];
-                const searchText = {text_escaped};
-                const exactMatch = {str(exact).lower()};
-
-                // Normalize text function - removes extra whitespace and normalizes
-                function normalizeText(text) {{
-                    return text.replace(/\\s+/g, ' ').trim().toLowerCase();
-                }}
-
-                // Check if element is truly visible and clickable
-                function isElementVisible(el) {{
-                    const rect = el.getBoundingClientRect();
-                    const style = window.getComputedStyle(el);
-
-                    return rect.width > 0 &&
-                           rect.height > 0 &&
-                           style.display !== 'none' &&
-                           style.visibility !== 'hidden' &&
-                           parseFloat(style.opacity) > 0 &&  // FIXED (v3.0.1): numeric comparison
-                           el.offsetParent !== null;
-                }}
-
-                // Get direct text content (without nested elements)
-                function getDirectText(el) {{
-                    let text = '';
-                    for (let node of el.childNodes) {{
-                        if (node.nodeType === Node.TEXT_NODE) {{
-                            text += node.textContent;
-                        }}
-                    }}
-                    return text.trim();
-                }}
-
-                // Find best matching element
-                const searchNorm = normalizeText(searchText);
-                let bestMatch = null;
-                let bestScore = 0;
-
-                // Get viewport dimensions for scoring (v3.0.0)
-                const viewportWidth = window.innerWidth;
-                const viewportHeight = window.innerHeight;
-
-                for (const el of elements) {{
-                    if (!isElementVisible(el)) continue;
-
-                    // Get element position for viewport scoring
-                    const rect = el.getBoundingClientRect();
-
-                    // Get various text representations
-                    const fullText = normalizeText(el.textContent || '');
-                    const directText = normalizeText(getDirectText(el));
-                    const ariaLabel = normalizeText(el.getAttribute('aria-label') || '');
-                    const title = normalizeText(el.title || '');
-                    const value = normalizeText(el.value || '');
-                    const placeholder = normalizeText(el.placeholder || '');
-
-                    let score = 0;
-                    let matched = false;
-
-                    if (exactMatch) {{
-                        // Exact match mode
-                        if (fullText === searchNorm || directText === searchNorm ||
-                            ariaLabel === searchNorm || title === searchNorm ||
-                            value === searchNorm || placeholder === searchNorm) {{
-                            matched = true;
-                            score = 100;
-                            // Prefer elements with less nested content
-                            if (directText === searchNorm) score += 50;
-                        }}
-                    }} else {{
-                        // Partial match mode
-                        if (fullText.includes(searchNorm)) {{
-                            matched = true;
-                            score = 50;
-                            // Prefer direct text match
-                            if (directText.includes(searchNorm)) score += 30;
-                            // Prefer shorter text (more specific)
-                            if (fullText.length < 100) score += 10;
-                        }}
-                        if (ariaLabel.includes(searchNorm)) {{
-                            matched = true;
-                            score = Math.max(score, 70);
-                        }}
-                        if (title.includes(searchNorm)) {{
-                            matched = true;
-                            score = Math.max(score, 60);
-                        }}
-                        if (value.includes(searchNorm)) {{
-                            matched = true;
-                            score = Math.max(score, 80);
-                        }}
-                        if (placeholder.includes(searchNorm)) {{
-                            matched = true;
-                            score = Math.max(score, 40);
-                        }}
-                    }}
-
-                    // VIEWPORT SCORING (v3.0.0): Prefer elements in viewport and center
-                    if (matched) {{
-                        // Bonus for element in viewport (+15 points)
-                        const inViewport = rect.top >= 0 && rect.left >= 0 &&
-                                          rect.bottom <= viewportHeight &&
-                                          rect.right <= viewportWidth;
-                        if (inViewport) {{
-                            score += 15;
-
-                            // Additional bonus for center zone (20-80% of viewport) (+10 points)
-                            const centerMinX = viewportWidth * 0.2;
-                            const centerMaxX = viewportWidth * 0.8;
-                            const centerMinY = viewportHeight * 0.2;
-                            const centerMaxY = viewportHeight * 0.8;
-
-                            const elCenterX = rect.left + rect.width / 2;
-                            const elCenterY = rect.top + rect.height / 2;
-
-                            if (elCenterX >= centerMinX && elCenterX <= centerMaxX &&
-                                elCenterY >= centerMinY && elCenterY <= centerMaxY) {{
-                                score += 10;
-                            }}
-                        }} else {{
-                            // Penalty for elements outside viewport (-5 points)
-                            score -= 5;
-                        }}
-
-                        // Bonus for elements near top (first 500px) - likely more important (+5 points)
-                        if (rect.top >= 0 && rect.top < 500) {{
-                            score += 5;
-                        }}
-                    }}
-
-                    if (matched && score > bestScore) {{
-                        bestScore = score;
-                        bestMatch = el;
-                    }}
-                }}
-
-                const el = bestMatch;
-
-                if (!el) {{
-                    // Better debug information
-                    const visibleElements = elements.filter(isElementVisible);
-                    const partialMatches = visibleElements.filter(e => {{
-                        const text = normalizeText(e.textContent || '');
-                        return text.includes(searchNorm) || searchNorm.includes(text);
-                    }});
-
-                    return {{
-                        success: false,
-                        message: `Element with text not found: "${{searchText}}"`,
-                        searchedTags: semanticTags,
-                        totalElements: elements.length,
-                        visibleElements: visibleElements.length,
-                        partialMatches: partialMatches.length,
-                        availableTexts: visibleElements.slice(0, 15).map(e => ({{
-                            tag: e.tagName,
-                            text: e.textContent.trim().substring(0, 60),
-                            ariaLabel: e.getAttribute('aria-label'),
-                            role: e.getAttribute('role')
-                        }}))
-                    }};
-                }}
-
-                // Scroll into view if needed
-                const rect = el.getBoundingClientRect();
-                let clickX = Math.round(rect.left + rect.width / 2);
-                let clickY = Math.round(rect.top + rect.height / 2);
+            tags, fallback_tags = ((tag,), ()) if tag else (_SEMANTIC_CLICK_TAGS, _FALLBACK_CLICK_TAGS)
 
-                const inViewport = rect.top >= 0 && rect.left >= 0 &&
-                                  rect.bottom <= window.innerHeight &&
-                                  rect.right <= window.innerWidth;
-
-                if (!inViewport) {{
-                    el.scrollIntoView({{ behavior: 'smooth', block: 'center', inline: 'center' }});
-                    await new Promise(r => setTimeout(r, 300));
-                    // Recalculate after scroll
-                    const newRect = el.getBoundingClientRect();
-                    clickX = Math.round(newRect.left + newRect.width / 2);
-                    clickY = Math.round(newRect.top + newRect.height / 2);
-                }}
-
-                // Debug logging
-                console.log('[MCP] Click target:', {{
-                    searchText: searchText,
-                    foundText: el.textContent.trim().substring(0, 100),
-                    tag: el.tagName,
-                    score: bestScore,
-                    coords: {{ x: clickX, y: clickY }},
-                    rect: {{ left: rect.left, top: rect.top, width: rect.width, height: rect.height }}
-                }});
-
-                // Animate cursor and wait for completion (v3.0.0: reduced to 200ms)
-                if (window.__moveAICursor__) {{
-                    window.__moveAICursor__(clickX, clickY, 200);
-                    await new Promise(r => setTimeout(r, 200)); // Wait for cursor animation
-                }}
-
-                // Show click animation and wait (v3.0.0: reduced to 200ms)
-                if (window.__clickAICursor__) {{
-                    window.__clickAICursor__();
-                    await new Promise(r => setTimeout(r, 200)); // Wait for click flash
-                }}
-
-                // Now perform the actual click
-                let clicked = false;
-
-                // Method 1: Direct click
-                try {{
-                    el.click();
-                    clicked = true;
-                }} catch (e1) {{
-                    console.warn('[MCP] Direct click failed:', e1);
-                }}
-
-                // Method 2: Dispatch mouse events
-                try {{
-                    ['mousedown', 'mouseup', 'click'].forEach(eventType => {{
-                        const event = new MouseEvent(eventType, {{
-                            view: window,
-                            bubbles: true,
-                            cancelable: true,
-                            clientX: clickX,
-                            clientY: clickY
-                        }});
-                        el.dispatchEvent(event);
-                    }});
-                    clicked = true;
-                }} catch (e2) {{
-                    console.warn('[MCP] Mouse events failed:', e2);
-                }}
-
-                // Method 3: Focus and trigger onclick
-                if (el.tagName === 'BUTTON' || el.tagName === 'A' || el.tagName === 'INPUT') {{
-                    try {{
-                        el.focus();
-                        if (el.onclick) {{
-                            el.onclick.call(el);
-                            clicked = true;
-                        }}
-                    }} catch (e3) {{
-                        console.warn('[MCP] Focus/onclick failed:', e3);
-                    }}
-                }}
-
-                return {{
-                    success: clicked,
-                    searchText: searchText,
-                    matchScore: bestScore,
-                    message: clicked ? `Clicked element with text: "${{searchText}}"` : 'All click methods failed',
-                    cursorVisible: window.__aiCursor__ && window.__aiCursor__.style.display !== 'none',
-                    element: {{
-                        tag: el.tagName,
-                        id: el.id,
-                        className: el.className,
-                        actualText: el.textContent.trim().substring(0, 100),
-                        ariaLabel: el.getAttribute('aria-label'),
-                        role: el.getAttribute('role'),
-                        position: {{ x: clickX, y: clickY }}
-                    }}
-                }};
-            }})()
-            """
-
-            # Use AsyncCDP wrapper for thread-safe evaluation (STABILITY FIX)
-            result = await self.context.cdp.evaluate(expression=js_code, returnByValue=True, awaitPromise=True)
+            # Preloaded helper: no script parse per click, arguments passed by value
+            try:
+                click_result = await self.context.cdp.call_helper(
+                    "click_by_text",
+                    {"text": text, "tags": tags, "fallbackTags": fallback_tags, "exact": exact, "verbose": verbose}
+                )
+            except CDPError as e:
+                logger.error(f"✗ click_by_text helper failed for '{text}': {e.message}")
+                return {
+                    "success": False,
+                    "reason": "javascript_error",
+                    "message": f"JavaScript error while clicking '{text}': {e.message}",
+                    "exception": e.message
+                }
 
             # Debug logging
-            logger.debug(f"click_by_text CDP result: {result}")
-
-            click_result = result.get('result', {}).get('value')
+            logger.debug(f"click_by_text result: {click_result}")
 
             # Handle None or missing value
             if not click_result or not isinstance(click_result, dict):
-                logger.error(f"✗ Invalid click_by_text result for '{text}'")
-                logger.error(f"   Raw CDP result: {result}")
-                logger.error(f"   Extracted value: {click_result}")
-                logger.error(f"   Value type: {type(click_result)}")
-
-                # Check for exception in CDP result
-                if 'exceptionDetails' in result:
-                    exception = result['exceptionDetails']
-                    return {
-                        "success": False,
-                        "reason": "javascript_error",
-                        "message": f"JavaScript error while clicking '{text}': {exception.get('text', 'Unknown error')}",
-                        "exception": str(exception)
-                    }
-
+                logger.error(f"✗ Invalid click_by_text result for '{text}': {click_result!r}")
                 return {
                     "success": False,
                     "reason": "invalid_result",
                     "message": f"Click by text returned invalid result for: {text}",
-                    "raw_result": str(result),
-                    "debug_info": f"result.keys={list(result.keys())}, value={click_result}, type={type(click_result).__name__}"
+                    "raw_result": str(click_result),
+                    "debug_info": f"value={click_result}, type={type(click_result).__name__}"
                 }
 
             # Log result to stderr for debugging
@@ -729,8 +1231,10 @@ Tip: Use save_page_info() first to see available elements and verify click worke
 class ScrollPageCommand(Command):
     """Scroll page or element"""
 
+    __slots__ = ()
+
     name = "scroll_page"
-    description = "Scroll the page or a specific element. Returns detailed position information."
+    description = "Scroll the page or a specific element. Returns the new scroll position (set detailed for page/element size metrics)."
     input_schema = {
         "type": "object",
         "properties": {
@@ -738,129 +1242,107 @@ class ScrollPageCommand(Command):
             "amount": {"type": "integer", "description": "Pixels to scroll (default: 500 for page, 300 for element)"},
             "x": {"type": "integer", "description": "Absolute X coordinate to scroll to"},
             "y": {"type": "integer", "description": "Absolute Y coordinate to scroll to"},
-            "selector": {"type": "string", "description": "CSS selector of element to scroll"}
+            "selector": {"type": "string", "description": "CSS selector of element to scroll"},
+            "detailed": {"type": "boolean", "description": "Also return page/element size metrics (forces a layout read)", "default": False}
         }
     }
 
     requires_cdp = True  # Uses AsyncCDP wrapper for thread-safe evaluation
+    preserves_page_state = True  # Keeps the cached page position up to date itself
 
     async def execute(self, direction: str = "down", amount: Optional[int] = None,
                      x: Optional[int] = None, y: Optional[int] = None,
-                     selector: Optional[str] = None) -> Dict[str, Any]:
-        """Execute scroll operation"""
-        try:
-            # Validate coordinates if provided
-            if x is not None or y is not None:
-                x, y = Validators.validate_coordinates(x, y, allow_negative=False)
-
-            # Validate selector if provided
-            if selector:
-                selector = Validators.validate_selector(selector, "selector")
-
-            # Validate amount if provided
-            if amount is not None:
-                amount = int(Validators.validate_range(amount, "amount", min_value=0, max_value=50000))
-
-            # Build JavaScript based on parameters
-            if x is not None and y is not None:
-                js_code = f"""
-                (function() {{
-                    window.scrollTo({x}, {y});
-                    return {{
-                        x: window.pageXOffset || window.scrollX,
-                        y: window.pageYOffset || window.scrollY,
-                        maxX: document.documentElement.scrollWidth - window.innerWidth,
-                        maxY: document.documentElement.scrollHeight - window.innerHeight,
-                        viewportHeight: window.innerHeight,
-                        viewportWidth: window.innerWidth,
-                        pageHeight: document.documentElement.scrollHeight,
-                        pageWidth: document.documentElement.scrollWidth
-                    }};
-                }})()
-                """
-            elif selector:
-                if amount is None:
-                    amount = 300
-                scroll_delta = amount if direction in ["down", "right"] else -amount
-                scroll_property = "scrollTop" if direction in ["down", "up"] else "scrollLeft"
-
-                js_code = f"""
-                (function() {{
-                    const el = document.querySelector('{selector}');
-                    if (!el) return {{success: false, message: 'Element not found: {selector}'}};
-
-                    el.{scroll_property} += {scroll_delta};
-
-                    return {{
-                        success: true,
-                        element: '{selector}',
-                        scrollTop: el.scrollTop,
-                        scrollLeft: el.scrollLeft,
-                        scrollHeight: el.scrollHeight,
-                        scrollWidth: el.scrollWidth,
-                        clientHeight: el.clientHeight,
-                        clientWidth: el.clientWidth
-                    }};
-                }})()
-                """
-            else:
-                if amount is None:
-                    amount = 500
-
-                scroll_map = {
-                    "down": f"window.scrollBy(0, {amount})",
-                    "up": f"window.scrollBy(0, -{amount})",
-                    "left": f"window.scrollBy(-{amount}, 0)",
-                    "right": f"window.scrollBy({amount}, 0)",
-                    "top": "window.scrollTo(0, 0)",
-                    "bottom": "window.scrollTo(0, document.documentElement.scrollHeight)"
+                     selector: Optional[str] = None, detailed: bool = False) -> Dict[str, Any]:
+        """Execute scroll operation
+
+        Raises:
+            InvalidArgumentError: If coordinates, selector or amount are invalid
+            CDPError: If the scroll helper call fails
+        """
+        # Validate coordinates if provided (plain in-range ints skip the validator)
+        if not (_int_in_range(x, 0, Validators.MAX_COORDINATE)
+                and _int_in_range(y, 0, Validators.MAX_COORDINATE)):
+            x, y = Validators.validate_coordinates(x, y, allow_negative=False)
+
+        # Validate selector if provided (passed to the page helper by value,
+        # so only a type/emptiness check is needed)
+        if selector:
+            selector = Validators.validate_selector(selector, "selector", sanitize=False)
+
+        # Validate amount if provided
+        if not _int_in_range(amount, 0, 50000):
+            amount = int(Validators.validate_range(amount, "amount", min_value=0, max_value=50000))
+
+        # Build helper options based on parameters
+        absolute = x is not None and y is not None
+        if absolute:
+            opts = {"mode": "xy", "x": x, "y": y, "detailed": detailed}
+        elif selector:
+            if amount is None:
+                amount = 300
+
+            # Element scrolls are relative only (top/bottom apply to the page)
+            if direction not in _RELATIVE_SCROLL_DIRECTIONS:
+                return {"success": False, "message": f"Invalid direction for element scroll: {direction}"}
+
+            opts = {"mode": "selector", "selector": selector, "direction": direction,
+                    "amount": amount, "detailed": detailed}
+        else:
+            if amount is None:
+                amount = 500
+
+            if direction not in _SCROLL_DIRECTIONS:
+                return {"success": False, "message": f"Invalid direction: {direction}"}
+
+            opts = {"mode": "direction", "direction": direction, "amount": amount, "detailed": detailed}
+
+            # Already at the edge we'd scroll towards - nothing to send
+            cached = self.context.cdp.page_state.get("scroll_position")
+            if (cached and (not detailed or "maxY" in cached["position"])
+                    and _scroll_is_noop(direction, cached)):
+                return {
+                    "success": True,
+                    "direction": direction,
+                    "amount": amount,
+                    "selector": None,
+                    "position": cached["position"],
+                    "cached": True,
+                    "message": f"Page already at its scroll limit, nothing to scroll {direction}"
                 }
 
-                scroll_expr = scroll_map.get(direction)
-                if not scroll_expr:
-                    return {"success": False, "message": f"Invalid direction: {direction}"}
-
-                js_code = f"""
-                (function() {{
-                    {scroll_expr};
-                    return {{
-                        x: window.pageXOffset || window.scrollX,
-                        y: window.pageYOffset || window.scrollY,
-                        maxX: document.documentElement.scrollWidth - window.innerWidth,
-                        maxY: document.documentElement.scrollHeight - window.innerHeight,
-                        viewportHeight: window.innerHeight,
-                        viewportWidth: window.innerWidth,
-                        pageHeight: document.documentElement.scrollHeight,
-                        pageWidth: document.documentElement.scrollWidth,
-                        scrolledToBottom: (window.innerHeight + window.pageYOffset) >= document.documentElement.scrollHeight - 10,
-                        scrolledToTop: window.pageYOffset <= 10
-                    }};
-                }})()
-                """
-
-            # Use AsyncCDP wrapper for thread-safe evaluation (STABILITY FIX)
-            result = await self.context.cdp.evaluate(expression=js_code, returnByValue=True)
-            scroll_info = result.get('result', {}).get('value', {})
-
-            if selector and not scroll_info.get('success', True):
-                return scroll_info
-
-            return {
-                "success": True,
-                "direction": direction if not (x is not None and y is not None) else "absolute",
-                "amount": amount,
-                "selector": selector,
+        # Use AsyncCDP wrapper for thread-safe evaluation (STABILITY FIX)
+        scroll_info = await self.context.cdp.call_helper("scroll", opts) or {}
+
+        # Element rects are viewport-relative - any scroll makes them stale
+        self.context.cdp.page_state.pop("element_rects", None)
+
+        if not selector:
+            self.context.cdp.page_state["scroll_position"] = {
                 "position": scroll_info,
-                "message": f"Scrolled {'element ' + selector if selector else 'page'} {direction if not (x is not None and y is not None) else f'to ({x}, {y})'}"
+                "direction": opts.get("direction", "absolute"),
+                "time": time.monotonic()
             }
-        except Exception as e:
-            raise RuntimeError(f"Failed to scroll page: {str(e)}")
+
+        if selector and not scroll_info.get('success', True):
+            return scroll_info
+
+        target = 'element ' + selector if selector else 'page'
+        return {
+            "success": True,
+            "direction": "absolute" if absolute else direction,
+            "amount": amount,
+            "selector": selector,
+            "position": scroll_info,
+            "message": f"Scrolled {target} to ({x}, {y})" if absolute else f"Scrolled {target} {direction}"
+        }
 
 
 @register
 class MoveCursorCommand(Command):
     """Move AI cursor to position"""
 
+    __slots__ = ()
+
     name = "move_cursor"
     description = "Move the visual AI cursor to specific coordinates or element center."
     input_schema = {
@@ -875,77 +1357,159 @@ class MoveCursorCommand(Command):
 
     requires_cursor = True
     requires_cdp = True  # Uses AsyncCDP wrapper for thread-safe evaluation
+    # Selector moves only animate the cursor overlay; coordinate moves send a
+    # native mouse move and drop the cached geometry themselves
+    preserves_page_state = True
+
+    # Cursor moves running in the background (kept referenced until done)
+    _pending_moves: set = set()
+
+    def _fire_and_forget(self, coro):
+        """Run a cursor move off the caller's critical path, logging failures"""
+        task = asyncio.ensure_future(coro)
+        self._pending_moves.add(task)
+
+        def _done(t):
+            self._pending_moves.discard(t)
+            if t.cancelled():
+                return
+            if t.exception():
+                logger.warning(f"Background cursor move failed: {t.exception()}")
+            elif not t.result().get('success'):
+                logger.warning(f"Background cursor move failed: {t.result().get('message')}")
+
+        task.add_done_callback(_done)
+
+    async def _send_move(self, x: float, y: float, duration: int, native: bool = False) -> Dict[str, Any]:
+        """Move the cursor to (x, y) and record the outcome in page_state
+
+        cursor_position is only written once the move helper has succeeded,
+        and "cursor_ready" tells later calls that moves on this page work and
+        may run in the background. A failure (e.g. cursor not initialized)
+        clears it, so the next move runs synchronously and reports the error.
+
+        Args:
+            x: Target X coordinate
+            y: Target Y coordinate
+            duration: Animation duration in ms
+            native: Also dispatch a native mouseMoved event
+
+        Returns:
+            Move helper result value
+        """
+        cdp = self.context.cdp
+        epoch = cdp.page_epoch
+        move = cdp.call_helper("move", {"x": x, "y": y, "duration": duration})
+        if native:
+            _, value = await asyncio.gather(cdp.dispatch_mouse_event("mouseMoved", x, y), move)
+        else:
+            value = await move
+        value = value or {}
+
+        # A move that finishes after a navigation says nothing about the new page
+        if cdp.page_epoch == epoch:
+            if value.get('success'):
+                cdp.page_state["cursor_ready"] = True
+                cdp.page_state["cursor_position"] = (x, y)
+            else:
+                cdp.page_state.pop("cursor_ready", None)
+        return value
+
+    def _cursor_already_at(self, x: float, y: float) -> bool:
+        """Check whether the last move on this page already went to (about) (x, y)"""
+        last = self.context.cdp.page_state.get("cursor_position")
+        return last is not None and abs(last[0] - x) + abs(last[1] - y) < _CURSOR_MOVE_THRESHOLD
+
+    async def _move_to_element(self, selector: str, duration: int) -> Dict[str, Any]:
+        """Move cursor to element center, reusing a recently measured rect
+
+        Rects are viewport-relative, so the cache lives in AsyncCDP.page_state
+        (cleared by navigation, scrolling and any layout-changing command) and
+        entries are only trusted for a short time.
+
+        Args:
+            selector: CSS selector of target element
+            duration: Animation duration in ms
+
+        Returns:
+            Move helper result value
+        """
+        page_state = self.context.cdp.page_state
+        rects = page_state.setdefault("element_rects", {})
+        cached = rects.get(selector)
+        if cached and time.monotonic() - cached["time"] <= _RECT_CACHE_TTL:
+            # Target already known - the animation is all that's left, don't wait
+            # for it once the cursor is known to work on this page
+            position = cached["info"]["position"]
+            if not self._cursor_already_at(position["x"], position["y"]):
+                if not page_state.get("cursor_ready"):
+                    value = await self._send_move(position["x"], position["y"], duration)
+                    if not value.get('success'):
+                        return value
+                else:
+                    self._fire_and_forget(self._send_move(position["x"], position["y"], duration))
+            return dict(cached["info"], cached=True)
+
+        # Element lookup stays in the page helper: one round-trip instead of
+        # DOM.getDocument + querySelector + getBoxModel
+        value = await self.context.cdp.call_helper("move", {"selector": selector, "duration": duration}) or {}
+        if value.get('success'):
+            rects[selector] = {"info": value, "time": time.monotonic()}
+            page_state["cursor_ready"] = True
+            page_state["cursor_position"] = (value["position"]["x"], value["position"]["y"])
+        return value
 
     async def execute(self, x: Optional[int] = None, y: Optional[int] = None,
                      selector: Optional[str] = None, duration: int = 400, **kwargs) -> Dict[str, Any]:
-        """Execute cursor movement"""
+        """Execute cursor movement
+
+        Invalid arguments are reported in the result; CDP failures propagate.
+        """
         try:
-            # Validate coordinates if provided
-            if x is not None or y is not None:
+            # Validate coordinates if provided (plain in-range ints skip the validator)
+            if not (_int_in_range(x, 0, Validators.MAX_COORDINATE)
+                    and _int_in_range(y, 0, Validators.MAX_COORDINATE)):
                 x, y = Validators.validate_coordinates(x, y, allow_negative=False)
 
-            # Validate selector if provided
+            # Validate selector if provided (passed to the page helper by value,
+            # so only a type/emptiness check is needed)
             if selector:
-                selector = Validators.validate_selector(selector, "selector")
+                selector = Validators.validate_selector(selector, "selector", sanitize=False)
 
             # Validate duration
-            duration = int(Validators.validate_range(duration, "duration", min_value=0, max_value=10000))
+            if not _int_in_range(duration, 0, 10000):
+                duration = int(Validators.validate_range(duration, "duration", min_value=0, max_value=10000))
 
             if selector:
-                js_code = f"""
-                (function() {{
-                    const el = document.querySelector('{selector}');
-                    if (!el) {{
-                        return {{success: false, message: 'Element not found: {selector}'}};
-                    }}
-
-                    const rect = el.getBoundingClientRect();
-                    const centerX = rect.left + rect.width / 2;
-                    const centerY = rect.top + rect.height / 2;
-
-                    if (window.__moveAICursor__) {{
-                        window.__moveAICursor__(centerX, centerY, {duration});
-                        return {{
-                            success: true,
-                            message: 'Cursor moved to element: {selector}',
-                            position: {{x: centerX, y: centerY}},
-                            element: {{
-                                tagName: el.tagName,
-                                id: el.id,
-                                className: el.className,
-                                bounds: {{
-                                    top: rect.top,
-                                    left: rect.left,
-                                    width: rect.width,
-                                    height: rect.height
-                                }}
-                            }}
-                        }};
-                    }} else {{
-                        return {{success: false, message: 'AI cursor not initialized'}};
-                    }}
-                }})()
-                """
+                return await self._move_to_element(selector, duration)
             elif x is not None and y is not None:
-                js_code = f"""
-                (function() {{
-                    if (window.__moveAICursor__) {{
-                        window.__moveAICursor__({x}, {y}, {duration});
-                        return {{
-                            success: true,
-                            message: 'Cursor moved to coordinates',
-                            position: {{x: {x}, y: {y}}}
-                        }};
-                    }} else {{
-                        return {{success: false, message: 'AI cursor not initialized'}};
-                    }}
-                }})()
-                """
+                result = {
+                    "success": True,
+                    "message": "Cursor moved to coordinates",
+                    "position": {"x": x, "y": y}
+                }
+                # Re-issued move to where the cursor already is - nothing to send
+                if self._cursor_already_at(x, y):
+                    last_x, last_y = self.context.cdp.page_state["cursor_position"]
+                    return dict(result, position={"x": last_x, "y": last_y}, cached=True)
+
+                # A native mouse move fires :hover styles, mouseenter handlers, menus
+                # and tooltips, any of which can change layout: cached rects and
+                # scroll positions no longer describe the page
+                page_state = self.context.cdp.page_state
+                page_state.pop("element_rects", None)
+                page_state.pop("scroll_position", None)
+
+                # The native mouse move and cursor animation are sent together. Until
+                # a move has worked on this page (the cursor may not be initialized)
+                # they are awaited, so failures are reported; after that they run in
+                # the background and the answer comes right away
+                if not page_state.get("cursor_ready"):
+                    value = await self._send_move(x, y, duration, native=True)
+                    return result if value.get('success') else value
+                self._fire_and_forget(self._send_move(x, y, duration, native=True))
+                return result
             else:
                 return {"success": False, "message": "Either provide x,y coordinates or selector"}
-
-            # Use AsyncCDP wrapper for thread-safe evaluation (STABILITY FIX)
-            result = await self.context.cdp.evaluate(expression=js_code, returnByValue=True)
-            return result.get('result', {}).get('value', {})
-        except Exception as e:
-            return {"success": False, "message": f"Failed to move cursor: {str(e)}", "error": str(e)}
+        except ValidationError as e:
+            return {"success": False, "message": f"Failed to move cursor: {e.message}", "error": e.message}
@@ -5,6 +5,7 @@ from urllib.parse import urlparse
 from .base import Command
 from .registry import register
 from mcp.logging_config import get_logger
+from browser.async_cdp import AsyncCDP
 from mcp.errors import (
     CommandError,
     CommandTimeoutError,
@@ -15,11 +16,21 @@ from mcp.errors import (
 
 logger = get_logger("commands.navigation")
 
+# Existence check and extraction in one page call: {found, text}
+_GET_TEXT_HELPER_JS = """function(selector) {
+    const el = document.querySelector(selector);
+    return el ? {found: true, text: el.textContent.trim()} : {found: false};
+}"""
+
+AsyncCDP.register_helper("get_text", _GET_TEXT_HELPER_JS)
+
 
 @register
 class OpenUrlCommand(Command):
     """Navigate to a URL"""
 
+    __slots__ = ()
+
     name = "open_url"
     description = "Open a URL in the Comet browser"
     input_schema = {
@@ -48,7 +59,8 @@ class OpenUrlCommand(Command):
             )
 
         try:
-            await self.cdp.navigate(url=url, timeout=30)
+            # Returns once the load event fires (or the 30s budget runs out)
+            await self.cdp.navigate(url=url, timeout=30, wait_for_load=True)
         except asyncio.TimeoutError:
             logger.error(f"✗ Navigation timeout: {url} (30s)")
             raise CommandTimeoutError(command="open_url", timeout_seconds=30)
@@ -56,12 +68,10 @@ class OpenUrlCommand(Command):
             logger.error(f"✗ Navigation failed: {url} - {str(e)}")
             raise CDPError(f"Failed to navigate to URL: {str(e)}")
 
-        # Wait for page load
-        await asyncio.sleep(2)
-
-        # Re-initialize cursor after page load (navigation clears it)
+        # Re-initialize cursor after page load (navigation clears it), unless
+        # the bootstrap registered for new documents has already done so
         cursor = self.context.cursor
-        if cursor:
+        if cursor and not cursor.persistent:
             try:
                 await cursor.initialize()
             except Exception as e:
@@ -76,6 +86,8 @@ class OpenUrlCommand(Command):
 class GetTextCommand(Command):
     """Extract text from elements"""
 
+    __slots__ = ()
+
     name = "get_text"
     description = "Get text content from elements matching a CSS selector"
     input_schema = {
@@ -87,6 +99,7 @@ class GetTextCommand(Command):
     }
 
     requires_cdp = True
+    preserves_page_state = True  # Read-only
 
     async def execute(self, selector: str) -> Dict[str, Any]:
         """Extract text content from selected element"""
@@ -102,23 +115,15 @@ class GetTextCommand(Command):
             )
 
         try:
-            # Query selector using AsyncCDP
-            result = await self.cdp.query_selector(selector=selector)
+            # One round-trip: lookup and text extraction run in the same page call
+            # (selector passed by value, never spliced into JS source)
+            result = await self.cdp.call_helper("get_text", selector) or {}
 
-            if not result.get('nodeId'):
+            if not result.get('found'):
                 logger.warning(f"✗ Element not found: '{selector}'")
                 raise ElementNotFoundError(selector=selector)
 
-            # Use JS to get text content (escape selector properly)
-            js_code = f"""
-            (function() {{
-                const el = document.querySelector({repr(selector)});
-                return el ? el.textContent.trim() : '';
-            }})()
-            """
-
-            eval_result = await self.cdp.evaluate(expression=js_code, returnByValue=True)
-            text = eval_result.get('result', {}).get('value', '')
+            text = result.get('text', '')
 
             logger.info(f"✓ Text extracted from '{selector}': {text[:50]}{'...' if len(text) > 50 else ''}")
             return {"success": True, "text": text, "selector": selector}
@@ -1,6 +1,6 @@
 """Open DevTools in separate tab"""
-import requests
 from typing import Dict, Any
+from yarl import URL
 from .base import Command
 from .registry import register
 from mcp.logging_config import get_logger
@@ -12,6 +12,8 @@ logger = get_logger("commands.open_devtools_url")
 class OpenDevToolsUrlCommand(Command):
     """Open DevTools UI in a new browser tab"""
 
+    __slots__ = ()
+
     name = "open_devtools_ui"
     description = "Open Chrome DevTools UI in a new tab for full debugging access"
     input_schema = {
@@ -20,6 +22,7 @@ class OpenDevToolsUrlCommand(Command):
     }
 
     requires_browser = True
+    requires_connection = True  # Shared HTTP session and detected debug host
 
     async def execute(self, **kwargs) -> Dict[str, Any]:
         """Open DevTools UI in new tab"""
@@ -31,21 +34,18 @@ class OpenDevToolsUrlCommand(Command):
             if hasattr(browser, '_url'):
                 debug_host = browser._url.split('://')[1].split(':')[0]
             else:
-                # Fallback: auto-detect WSL host
-                try:
-                    with open('/etc/resolv.conf', 'r') as f:
-                        for line in f:
-                            if line.startswith('nameserver'):
-                                debug_host = line.split()[1]
-                                break
-                except:
-                    debug_host = "127.0.0.1"
+                # Fallback: the WSL host the connection detected from
+                # /etc/resolv.conf once, at startup (or localhost)
+                debug_host = self.context.connection.debug_host or "127.0.0.1"
 
             debug_port = 9222
 
+            # Non-blocking HTTP on the connection's shared session
+            session = self.context.connection.http_session()
+
             # Get current tab's DevTools URL
-            response = requests.get(f"http://{debug_host}:{debug_port}/json")
-            tabs_info = response.json()
+            async with session.get(f"http://{debug_host}:{debug_port}/json") as response:
+                tabs_info = await response.json(content_type=None)
 
             if not tabs_info:
                 return {
@@ -72,8 +72,11 @@ class OpenDevToolsUrlCommand(Command):
                 ws_path = '/'.join(ws_part.split('/')[1:])
                 devtools_url = f"http://{debug_host}:{debug_port}/devtools/inspector.html?ws={debug_host}:{debug_port}/devtools/page/{ws_path.split('/')[-1]}"
 
-            # Open DevTools URL in new tab using CDP
-            new_tab_response = requests.put(f"http://{debug_host}:{debug_port}/json/new?{devtools_url}")
+            # Open DevTools URL in new tab using CDP (the target URL goes after
+            # '?' verbatim, so the request URL must not be re-quoted)
+            new_tab_url = URL(f"http://{debug_host}:{debug_port}/json/new?{devtools_url}", encoded=True)
+            async with session.put(new_tab_url) as new_tab_response:
+                await new_tab_response.read()
 
             return {
                 "success": True,
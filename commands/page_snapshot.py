@@ -11,6 +11,8 @@ logger = get_logger("commands.page_snapshot")
 class PageSnapshotCommand(Command):
     """Get lightweight text-based page snapshot instead of heavy screenshot"""
 
+    __slots__ = ()
+
     name = "get_page_snapshot"
     description = """Get lightweight text-based page snapshot.
 
@@ -20,13 +22,15 @@ After calling this, use Read('./page_info.json') to see page snapshot."""
         "type": "object",
         "properties": {
             "include_styles": {"type": "boolean", "description": "Include computed styles", "default": False},
-            "max_depth": {"type": "integer", "description": "Max DOM depth to traverse", "default": 3}
+            "max_depth": {"type": "integer", "description": "Max DOM depth to traverse", "default": 3},
+            "max_interactive": {"type": "integer", "description": "Max interactive elements to include (0 = no limit)", "default": 50}
         }
     }
 
-    async def execute(self, include_styles: bool = False, max_depth: int = 3) -> Dict[str, Any]:
+    async def execute(self, include_styles: bool = False, max_depth: int = 3,
+                      max_interactive: int = 50) -> Dict[str, Any]:
         """Auto-redirect to save_page_info (workaround for MCP output issue)"""
         from utils.page_scraper import PageScraper
 
         # Use shared scraping utility (eliminates code duplication)
-        return await PageScraper.scrape_and_save(self.context.cdp, "./page_info.json")
+        return await PageScraper.scrape_and_save(self.context.cdp, "./page_info.json", max_interactive)
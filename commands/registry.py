@@ -5,9 +5,12 @@ Provides @register decorator for auto-discovery of browser commands,
 eliminating manual registration in protocol.py.
 """
 
-from typing import Dict, Type, List
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Type, List, Set
 import importlib
-import pkgutil
+import os
+import threading
 from mcp.logging_config import get_logger
 
 logger = get_logger("commands.registry")
@@ -22,6 +25,9 @@ class CommandRegistry:
     """
 
     _commands: Dict[str, Type] = {}
+    _discovered: Set[str] = set()  # Packages already scanned by discover_commands
+    _lock = threading.Lock()  # Modules may be imported (and register) concurrently
+    _snapshot: Optional[Mapping[str, Type]] = None  # Read-only view handed out by get_all_commands
 
     @classmethod
     def register(cls, command_class: Type) -> Type:
@@ -44,11 +50,13 @@ class CommandRegistry:
             raise ValueError(f"Command {command_class.__name__} must define 'name' class attribute")
 
         name = command_class.name
-        if name in cls._commands:
-            logger.warning(f"Command '{name}' already registered, overwriting with {command_class.__name__}")
+        with cls._lock:
+            if name in cls._commands:
+                logger.warning(f"Command '{name}' already registered, overwriting with {command_class.__name__}")
 
-        cls._commands[name] = command_class
-        logger.debug(f"Registered command: {name} ({command_class.__name__})")
+            cls._commands[name] = command_class
+            cls._snapshot = None
+        logger.debug("Registered command: %s (%s)", name, command_class.__name__)
 
         return command_class
 
@@ -66,31 +74,45 @@ class CommandRegistry:
         Raises:
             KeyError: If command not found
         """
-        if name not in cls._commands:
+        command_class = cls._commands.get(name)
+        if command_class is None:
             raise KeyError(f"Command '{name}' not registered")
-        return cls._commands[name]
+        return command_class
 
     @classmethod
-    def get_all_commands(cls) -> Dict[str, Type]:
+    def get_all_commands(cls) -> Mapping[str, Type]:
         """
         Get all registered commands.
 
+        The snapshot is built once per registry change and shared between
+        callers, so it is read-only.
+
         Returns:
-            Dict mapping command names to command classes
+            Read-only mapping of command names to command classes
         """
-        return cls._commands.copy()
+        snapshot = cls._snapshot
+        if snapshot is None:
+            with cls._lock:
+                snapshot = cls._snapshot = MappingProxyType(dict(cls._commands))
+        return snapshot
 
     @classmethod
-    def discover_commands(cls, package_name: str = 'commands'):
+    def discover_commands(cls, package_name: str = 'commands', force: bool = False):
         """
         Automatically discover and import all command modules.
 
         Imports all Python modules in the commands package,
-        triggering @register decorators.
+        triggering @register decorators. Each package is scanned once;
+        repeated calls return immediately (until clear()).
 
         Args:
             package_name: Package to scan for command modules
+            force: Scan again even if the package was already discovered
         """
+        if package_name in cls._discovered and not force:
+            logger.debug(f"Commands in {package_name} already discovered")
+            return
+
         try:
             # Import the package
             package = importlib.import_module(package_name)
@@ -100,31 +122,59 @@ class CommandRegistry:
                 logger.warning(f"Package {package_name} has no __path__, skipping discovery")
                 return
 
-            # Discover all modules in package
-            module_names = []
-            for finder, name, ispkg in pkgutil.iter_modules(package.__path__, package.__name__ + '.'):
-                if not ispkg:  # Only import modules, not sub-packages
-                    module_names.append(name)
-
-            # Import each module
+            # Discover all modules in package: a plain directory listing of the
+            # .py files (sub-packages are directories and never match)
+            module_files = set()
+            for path in package.__path__:
+                with os.scandir(path) as entries:
+                    module_files.update(
+                        entry.name[:-3] for entry in entries
+                        if entry.name.endswith('.py') and entry.name != '__init__.py' and entry.is_file()
+                    )
+            module_names = [f"{package.__name__}.{name}" for name in sorted(module_files)]
+
+            # Import the modules concurrently (file reads and unmarshalling of
+            # independent modules overlap); a failing module is only logged
             logger.debug(f"Discovering commands in {len(module_names)} modules")
-            for module_name in module_names:
-                try:
-                    importlib.import_module(module_name)
-                    logger.debug(f"Imported module: {module_name}")
-                except Exception as e:
-                    logger.error(f"Failed to import {module_name}: {e}")
-
+            if module_names:
+                with ThreadPoolExecutor(max_workers=min(8, len(module_names)),
+                                        thread_name_prefix="discover-") as executor:
+                    list(executor.map(cls._import_module, module_names))
+
+            # Registration order depended on which import finished first;
+            # restore the module order (stable sort keeps in-module order)
+            module_order = {name: index for index, name in enumerate(module_names)}
+            with cls._lock:
+                ordered = sorted(
+                    cls._commands.items(),
+                    key=lambda item: module_order.get(item[1].__module__, -1)
+                )
+                cls._commands.clear()
+                cls._commands.update(ordered)
+                cls._snapshot = None
+
+            cls._discovered.add(package_name)
             logger.info(f"Command discovery complete: {len(cls._commands)} commands registered")
 
         except Exception as e:
             logger.error(f"Failed to discover commands: {e}")
             raise
 
+    @staticmethod
+    def _import_module(module_name: str):
+        """Import one command module, logging (not raising) failures"""
+        try:
+            importlib.import_module(module_name)
+            logger.debug("Imported module: %s", module_name)
+        except Exception as e:
+            logger.error(f"Failed to import {module_name}: {e}")
+
     @classmethod
     def clear(cls):
         """Clear all registered commands (useful for testing)"""
         cls._commands.clear()
+        cls._discovered.clear()
+        cls._snapshot = None
         logger.debug("Command registry cleared")
 
 
@@ -1,19 +1,277 @@
 """Save page info to file for debugging MCP output issues"""
-import json
-import os
 from typing import Dict, Any
 from .base import Command
 from .registry import register
-from utils.json_optimizer import JsonOptimizer
+from utils.page_scraper import PageScraper
 from mcp.logging_config import get_logger
+from browser.async_cdp import AsyncCDP
 
 logger = get_logger("commands.save_page_info")
 
+# Interactive elements, console, network and form structure of the page;
+# with serialize, {json, summary, consoleTotal} carrying it as indented JSON text
+_PAGE_INFO_HELPER_JS = """function(serialize) {
+    // One computed style object per element for the whole collection
+    const styleCache = new WeakMap();
+    function styleOf(el) {
+        let style = styleCache.get(el);
+        if (!style) {
+            style = window.getComputedStyle(el);
+            styleCache.set(el, style);
+        }
+        return style;
+    }
+
+    // checkVisibility() answers from the engine's visibility state
+    // instead of resolving a full computed style per element
+    function isVisibleStyle(el, checkOpacity) {
+        if (el.checkVisibility) {
+            return el.checkVisibility({checkVisibilityCSS: true, checkOpacity: checkOpacity});
+        }
+        const style = styleOf(el);
+        return style.display !== 'none' &&
+               style.visibility !== 'hidden' &&
+               (!checkOpacity || parseFloat(style.opacity) > 0);
+    }
+
+    // Memoized: form labels are looked up again for the flat input list
+    const textCache = new WeakMap();
+    function getVisibleText(el) {
+        if (!el) return '';
+        let text = textCache.get(el);
+        if (text === undefined) {
+            text = isVisibleStyle(el, false) ? (el.innerText || el.textContent || '').trim() : '';
+            textCache.set(el, text);
+        }
+        return text;
+    }
+
+    // CRITICAL FIX: Find ALL interactive elements (semantic + visually clickable).
+    // One DOM walk buckets everything the report needs: interactive
+    // candidates, forms, inputs, selects and the button/link counts
+    const semanticSelector = 'button, a, input[type="button"], input[type="submit"], [role="button"], [role="tab"], [role="link"], [onclick], .btn, .button, [tabindex]';
+    const potentialClickableTags = new Set(['div', 'span', 'li', 'section', 'article', 'header']);
+    // UPDATED (v3.0.1): Check for ANY interactive cursor type (expanded from pointer-only)
+    const interactiveCursors = new Set(['pointer', 'move', 'grab', 'grabbing', 'zoom-in', 'zoom-out', 'all-scroll']);
+
+    const semanticElements = [];
+    const cursorElements = [];
+    const formNodes = [];
+    const inputNodes = [];
+    const selectNodes = [];
+    let buttonCount = 0;
+    let linkCount = 0;
+    const rectCache = new WeakMap();
+    // Every label[for] per id, in document order
+    const labelsByFor = new Map();
+
+    const candidates = document.querySelectorAll(
+        semanticSelector + ', form, input, textarea, select, label[for], div, span, li, section, article, header');
+    for (const el of candidates) {
+        const tag = el.localName;
+        if (tag === 'button') buttonCount++;
+        else if (tag === 'a') linkCount++;
+        else if (tag === 'form') formNodes.push(el);
+        else if (tag === 'input' || tag === 'textarea') inputNodes.push(el);
+        else if (tag === 'select') selectNodes.push(el);
+        else if (tag === 'label') {
+            const forId = el.getAttribute('for');
+            if (forId !== null) {
+                const labels = labelsByFor.get(forId);
+                if (labels) labels.push(el);
+                else labelsByFor.set(forId, [el]);
+            }
+        }
+
+        // 1. Semantic clickable elements
+        if (el.matches(semanticSelector)) {
+            semanticElements.push(el);
+        // 2. Visually clickable elements. Only laid-out, non-empty boxes can
+        // pass the visibility filter below, so the cheap geometry checks run
+        // before resolving the cursor style
+        } else if (potentialClickableTags.has(tag) && el.offsetParent !== null) {
+            const rect = el.getBoundingClientRect();
+            if (rect.width > 0 && rect.height > 0 &&
+                (el.onclick !== null || interactiveCursors.has(styleOf(el).cursor))) {
+                cursorElements.push(el);
+                rectCache.set(el, rect);
+            }
+        }
+    }
+    // Semantic elements first, then cursor-detected ones (each in document order)
+    const interactiveElements = semanticElements.concat(cursorElements);
+
+    // Filter visible. All rects are read before any per-element
+    // style/text work, in a single layout pass
+    const rects = interactiveElements.map(el => rectCache.get(el) || el.getBoundingClientRect());
+    const interactive = [];
+    for (let i = 0; i < interactiveElements.length; i++) {
+        const el = interactiveElements[i];
+        const rect = rects[i];
+
+        // FIXED (v3.0.1): Complete visibility validation (was missing display/visibility/opacity)
+        if (!(rect.width > 0 &&
+              rect.height > 0 &&
+              el.offsetParent !== null &&
+              isVisibleStyle(el, true))) {
+            continue;
+        }
+
+        const style = styleOf(el);
+        interactive.push({
+            tag: el.tagName.toLowerCase(),
+            text: getVisibleText(el).substring(0, 100),
+            id: el.id || null,
+            classes: Array.from(el.classList || []),
+            position: {
+                x: Math.round(rect.left + rect.width/2),
+                y: Math.round(rect.top + rect.height/2)
+            },
+            clickable_reason: el.onclick || style.cursor === 'pointer' ? 'cursor-pointer' : 'semantic'
+        });
+    }
+
+    // Get console logs if available
+    const consoleLogs = window.__consoleHistory || [];
+
+    // Get network info (failures counted without an intermediate array)
+    const networkEntries = performance.getEntriesByType('resource') || [];
+    let failedRequests = 0;
+    for (const entry of networkEntries) {
+        if (entry.transferSize === 0) failedRequests++;
+    }
+
+    // Label of a form control: the first label[for] (inside root, if given,
+    // as root.querySelector would find it), then a wrapping <label>, then a
+    // <label> right before it
+    function findLabel(field, root) {
+        const labels = field.id ? labelsByFor.get(field.id) : undefined;
+        if (labels) {
+            const labelFor = root ? labels.find(label => root.contains(label)) : labels[0];
+            if (labelFor) return labelFor;
+        }
+        const wrapping = field.closest('label');
+        if (wrapping) return wrapping;
+        const prev = field.previousElementSibling;
+        return prev && prev.tagName === 'LABEL' ? prev : null;
+    }
+
+    // FORM AUTOMATION SUPPORT (v3.0.0): Extract form structures
+    const forms = formNodes.map(form => {
+        const fields = Array.from(form.querySelectorAll('input, textarea, select')).map(field => {
+            const label = findLabel(field, form);
+
+            return {
+                name: field.name || field.id || null,
+                type: field.type || field.tagName.toLowerCase(),
+                placeholder: field.placeholder || null,
+                value: field.value || null,
+                required: field.required || false,
+                disabled: field.disabled || false,
+                label: label ? getVisibleText(label) : null,
+                id: field.id || null,
+                selector: field.id ? `#${field.id}` : field.name ? `[name="${field.name}"]` : null
+            };
+        });
+
+        const submitBtn = form.querySelector('button[type="submit"], input[type="submit"]');
+
+        return {
+            id: form.id || null,
+            action: form.action || null,
+            method: form.method || 'GET',
+            field_count: fields.length,
+            fields: fields,
+            submit_button: submitBtn ? {
+                text: getVisibleText(submitBtn),
+                type: submitBtn.type,
+                id: submitBtn.id || null
+            } : null
+        };
+    });
+
+    // Extract all inputs (not just in forms)
+    const allInputs = inputNodes.map(input => {
+        const label = findLabel(input);
+
+        return {
+            name: input.name || input.id || null,
+            type: input.type || 'text',
+            placeholder: input.placeholder || null,
+            value: input.value || null,
+            required: input.required || false,
+            label: label ? getVisibleText(label) : null,
+            selector: input.id ? `#${input.id}` : input.name ? `[name="${input.name}"]` : null
+        };
+    });
+
+    // Extract all selects
+    const allSelects = selectNodes.map(select => {
+        const options = Array.from(select.options).map(opt => opt.text.trim());
+        const selectedValue = select.value;
+        const selectedText = select.options[select.selectedIndex]?.text.trim() || null;
+
+        const label = findLabel(select);
+
+        return {
+            name: select.name || select.id || null,
+            label: label ? getVisibleText(label) : null,
+            options: options,
+            selected_value: selectedValue,
+            selected_text: selectedText,
+            selector: select.id ? `#${select.id}` : select.name ? `[name="${select.name}"]` : null
+        };
+    });
+
+    const info = {
+        url: window.location.href,
+        title: document.title,
+        viewport: {
+            width: window.innerWidth,
+            height: window.innerHeight
+        },
+        interactive_elements: interactive,
+        forms: forms,
+        inputs: allInputs,
+        selects: allSelects,
+        console: {
+            logs: consoleLogs.slice(-10),  // Last 10 logs
+            total: consoleLogs.length
+        },
+        network: {
+            total_requests: networkEntries.length,
+            failed: failedRequests,
+            recent: networkEntries.slice(-5).map(e => ({
+                name: e.name.split('/').pop().substring(0, 50),
+                type: e.initiatorType,
+                duration: Math.round(e.duration)
+            }))
+        },
+        summary: {
+            total_buttons: buttonCount,
+            total_links: linkCount,
+            visible_interactive: interactive.length,
+            page_loaded: document.readyState === 'complete'
+        }
+    };
+
+    // Written to disk unmodified: serialize natively here instead of
+    // transferring the object and encoding it again in Python
+    if (serialize) {
+        return {json: JSON.stringify(info, null, 2), summary: info.summary, consoleTotal: consoleLogs.length};
+    }
+    return info;
+}"""
+
+AsyncCDP.register_helper("page_info", _PAGE_INFO_HELPER_JS)
+
 
 @register
 class SavePageInfoCommand(Command):
     """Save page snapshot to file (workaround for Claude Code not showing MCP results)"""
 
+    __slots__ = ()
+
     name = "save_page_info"
     description = """Save complete page state to JSON file. ALWAYS use Read tool after this to see results!
 
@@ -40,201 +298,28 @@ Contains: buttons/links positions, DevTools console (last 10 logs), network requ
 
     async def execute(self, output_file: str = "./page_info.json", full: bool = False) -> Dict[str, Any]:
         """Save page info to file (optimized by default, use full=True for debugging)"""
+        from utils.json_optimizer import JsonOptimizer
+
         logger.info(f"save_page_info: file={output_file}, full={full}")
         try:
-            js_code = """
-            (function() {
-                function getVisibleText(el) {
-                    if (!el) return '';
-                    const style = window.getComputedStyle(el);
-                    if (style.display === 'none' || style.visibility === 'hidden') return '';
-                    return (el.innerText || el.textContent || '').trim();
-                }
-
-                // CRITICAL FIX: Find ALL interactive elements (semantic + visually clickable)
-                let interactiveElements = [];
-
-                // 1. Semantic clickable elements
-                const semanticSelector = 'button, a, input[type="button"], input[type="submit"], [role="button"], [role="tab"], [role="link"], [onclick], .btn, .button, [tabindex]';
-                const semanticElements = Array.from(document.querySelectorAll(semanticSelector));
-                interactiveElements.push(...semanticElements);
-
-                // 2. Visually clickable elements - UPDATED (v3.0.1): All interactive cursors
-                const potentialClickable = Array.from(document.querySelectorAll('div, span, li, section, article, header'));
-                for (const el of potentialClickable) {
-                    const style = window.getComputedStyle(el);
-
-                    // Check for ANY interactive cursor type (v3.0.1: expanded from pointer-only)
-                    const interactiveCursors = ['pointer', 'move', 'grab', 'grabbing', 'zoom-in', 'zoom-out', 'all-scroll'];
-                    const hasInteractiveCursor = interactiveCursors.includes(style.cursor);
-
-                    if (hasInteractiveCursor || el.onclick !== null) {
-                        interactiveElements.push(el);
-                    }
-                }
-
-                // Remove duplicates and filter visible
-                const interactive = [...new Set(interactiveElements)]
-                    .filter(el => {
-                        const rect = el.getBoundingClientRect();
-                        const style = window.getComputedStyle(el);
-
-                        // FIXED (v3.0.1): Complete visibility validation (was missing display/visibility/opacity)
-                        return rect.width > 0 &&
-                               rect.height > 0 &&
-                               style.display !== 'none' &&
-                               style.visibility !== 'hidden' &&
-                               parseFloat(style.opacity) > 0 &&
-                               el.offsetParent !== null;
-                    })
-                    .map(el => {
-                        const rect = el.getBoundingClientRect();
-                        const style = window.getComputedStyle(el);
-                        return {
-                            tag: el.tagName.toLowerCase(),
-                            text: getVisibleText(el).substring(0, 100),
-                            id: el.id || null,
-                            classes: Array.from(el.classList || []),
-                            position: {
-                                x: Math.round(rect.left + rect.width/2),
-                                y: Math.round(rect.top + rect.height/2)
-                            },
-                            clickable_reason: el.onclick || style.cursor === 'pointer' ? 'cursor-pointer' : 'semantic'
-                        };
-                    });
-
-                // Get console logs if available
-                const consoleLogs = window.__consoleHistory || [];
-
-                // Get network info
-                const networkEntries = performance.getEntriesByType('resource') || [];
-
-                // FORM AUTOMATION SUPPORT (v3.0.0): Extract form structures
-                const forms = Array.from(document.querySelectorAll('form')).map(form => {
-                    const fields = Array.from(form.querySelectorAll('input, textarea, select')).map(field => {
-                        const label = form.querySelector(`label[for="${field.id}"]`) ||
-                                     field.closest('label') ||
-                                     field.previousElementSibling?.tagName === 'LABEL' ? field.previousElementSibling : null;
-
-                        return {
-                            name: field.name || field.id || null,
-                            type: field.type || field.tagName.toLowerCase(),
-                            placeholder: field.placeholder || null,
-                            value: field.value || null,
-                            required: field.required || false,
-                            disabled: field.disabled || false,
-                            label: label ? getVisibleText(label) : null,
-                            id: field.id || null,
-                            selector: field.id ? `#${field.id}` : field.name ? `[name="${field.name}"]` : null
-                        };
-                    });
-
-                    const submitBtn = form.querySelector('button[type="submit"], input[type="submit"]');
-
-                    return {
-                        id: form.id || null,
-                        action: form.action || null,
-                        method: form.method || 'GET',
-                        field_count: fields.length,
-                        fields: fields,
-                        submit_button: submitBtn ? {
-                            text: getVisibleText(submitBtn),
-                            type: submitBtn.type,
-                            id: submitBtn.id || null
-                        } : null
-                    };
-                });
-
-                // Extract all inputs (not just in forms)
-                const allInputs = Array.from(document.querySelectorAll('input, textarea')).map(input => {
-                    const label = document.querySelector(`label[for="${input.id}"]`) ||
-                                 input.closest('label') ||
-                                 input.previousElementSibling?.tagName === 'LABEL' ? input.previousElementSibling : null;
-
-                    return {
-                        name: input.name || input.id || null,
-                        type: input.type || 'text',
-                        placeholder: input.placeholder || null,
-                        value: input.value || null,
-                        required: input.required || false,
-                        label: label ? getVisibleText(label) : null,
-                        selector: input.id ? `#${input.id}` : input.name ? `[name="${input.name}"]` : null
-                    };
-                });
-
-                // Extract all selects
-                const allSelects = Array.from(document.querySelectorAll('select')).map(select => {
-                    const options = Array.from(select.options).map(opt => opt.text.trim());
-                    const selectedValue = select.value;
-                    const selectedText = select.options[select.selectedIndex]?.text.trim() || null;
-
-                    const label = document.querySelector(`label[for="${select.id}"]`) ||
-                                 select.closest('label') ||
-                                 select.previousElementSibling?.tagName === 'LABEL' ? select.previousElementSibling : null;
-
-                    return {
-                        name: select.name || select.id || null,
-                        label: label ? getVisibleText(label) : null,
-                        options: options,
-                        selected_value: selectedValue,
-                        selected_text: selectedText,
-                        selector: select.id ? `#${select.id}` : select.name ? `[name="${select.name}"]` : null
-                    };
-                });
-
-                return {
-                    url: window.location.href,
-                    title: document.title,
-                    viewport: {
-                        width: window.innerWidth,
-                        height: window.innerHeight
-                    },
-                    interactive_elements: interactive,
-                    forms: forms,
-                    inputs: allInputs,
-                    selects: allSelects,
-                    console: {
-                        logs: consoleLogs.slice(-10),  // Last 10 logs
-                        total: consoleLogs.length
-                    },
-                    network: {
-                        total_requests: networkEntries.length,
-                        failed: networkEntries.filter(e => e.transferSize === 0).length,
-                        recent: networkEntries.slice(-5).map(e => ({
-                            name: e.name.split('/').pop().substring(0, 50),
-                            type: e.initiatorType,
-                            duration: Math.round(e.duration)
-                        }))
-                    },
-                    summary: {
-                        total_buttons: document.querySelectorAll('button').length,
-                        total_links: document.querySelectorAll('a').length,
-                        visible_interactive: interactive.length,
-                        page_loaded: document.readyState === 'complete'
-                    }
-                };
-            })()
-            """
-
-            # Use AsyncCDP wrapper for thread-safe evaluation (STABILITY FIX)
-            result = await self.context.cdp.evaluate(expression=js_code, returnByValue=True)
-            page_info = result.get('result', {}).get('value', {})
-
-            # Optimize data (unless full=True)
-            optimized_data = JsonOptimizer.optimize_page_info(page_info, full=full)
-
-            # Save to file
-            os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(optimized_data, f, indent=2, ensure_ascii=False)
-
-            # Calculate size info
-            file_size = os.path.getsize(output_file)
+            # Page helper: its source is parsed once per document, not per call
+            if full:
+                # Saved as is - the page serializes it, Python only writes the text
+                page_info = await self.context.cdp.call_helper("page_info", True) or {}
+                file_size = await PageScraper.write_text(page_info.get('json', '{}'), output_file)
+                summary = page_info.get('summary', {})
+                console_total = page_info.get('consoleTotal', 0)
+            else:
+                page_info = await self.context.cdp.call_helper("page_info", False) or {}
+                optimized_data = JsonOptimizer.optimize_page_info(page_info)
+                file_size = await PageScraper.write_json(optimized_data, output_file)
+                summary = optimized_data.get('summary', {})
+                console_total = page_info.get('console', {}).get('total', 0)
             size_kb = round(file_size / 1024, 1)
 
             logger.info(f"✓ Page info saved: {output_file} ({size_kb}KB, {'full' if full else 'optimized'})")
-            logger.debug(f"  Elements: {len(page_info.get('interactive_elements', []))}, "
-                        f"Console logs: {page_info.get('console', {}).get('total', 0)}")
+            logger.debug(f"  Elements: {summary.get('visible_interactive', 0)}, "
+                        f"Console logs: {console_total}")
 
             return {
                 "success": True,
@@ -242,7 +327,7 @@ Contains: buttons/links positions, DevTools console (last 10 logs), network requ
                 "file": output_file,
                 "size_kb": size_kb,
                 "optimized": not full,
-                "summary": optimized_data.get('summary', {})
+                "summary": summary
             }
 
         except Exception as e:
@@ -1,5 +1,6 @@
 """Screenshot command with optimization support"""
-import base64
+import binascii
+import json
 import os
 from typing import Dict, Any, Optional
 from .base import Command
@@ -22,6 +23,8 @@ except ImportError:
 class ScreenshotCommand(Command):
     """Capture page screenshot with optimization options"""
 
+    __slots__ = ()
+
     name = "screenshot"
     description = """Take screenshot of current page with optimization options.
 
@@ -40,7 +43,7 @@ Auto-saves to ./screenshots/ folder. Use Read tool to view: Read('./screenshots/
 
 See SCREENSHOT_OPTIMIZATION.md for detailed benchmarks and recommendations.
 
-Note: Requires Pillow for JPEG/resize support. Install: pip install Pillow"""
+Note: Requires Pillow for resize support (max_width). Install: pip install Pillow"""
     input_schema = {
         "type": "object",
         "properties": {
@@ -57,7 +60,7 @@ Note: Requires Pillow for JPEG/resize support. Install: pip install Pillow"""
             },
             "quality": {
                 "type": "integer",
-                "description": "JPEG quality 1-100 (default: 80, requires Pillow)",
+                "description": "JPEG quality 1-100 (default: 80)",
                 "default": 80,
                 "minimum": 1,
                 "maximum": 100
@@ -143,12 +146,14 @@ Note: Requires Pillow for JPEG/resize support. Install: pip install Pillow"""
             cdp_result = self.tab.Page.captureScreenshot(**capture_params)
             img_data = cdp_result.get('data', '')
 
-            # Decode base64
-            img_bytes = base64.b64decode(img_data)
+            # Decode base64; binascii reads the ASCII str in place, where
+            # base64.b64decode would first copy it into a bytes object
+            img_bytes = binascii.a2b_base64(img_data)
             original_size = len(img_bytes)
 
-            # Apply optimization if Pillow available and needed
-            if PIL_AVAILABLE and (max_width or format == 'jpeg'):
+            # Chrome already encodes JPEG at the requested quality, so Pillow
+            # is only needed to resize
+            if PIL_AVAILABLE and max_width:
                 img_bytes = self._optimize_image(img_bytes, format, quality, max_width)
 
             # Save to file
@@ -174,7 +179,7 @@ Note: Requires Pillow for JPEG/resize support. Install: pip install Pillow"""
                 "message": message,
                 "size_kb": size_kb,
                 "format": format,
-                "optimized": PIL_AVAILABLE and (max_width is not None or format == 'jpeg')
+                "optimized": PIL_AVAILABLE and max_width is not None
             }
 
         except Exception as e:
@@ -190,7 +195,7 @@ Note: Requires Pillow for JPEG/resize support. Install: pip install Pillow"""
         try:
             js_code = f"""
             (function() {{
-                const el = document.querySelector({repr(selector)});
+                const el = document.querySelector({json.dumps(selector)});
                 if (!el) return null;
                 const rect = el.getBoundingClientRect();
                 return {{
@@ -220,9 +225,14 @@ Note: Requires Pillow for JPEG/resize support. Install: pip install Pillow"""
             return img_bytes
 
         try:
-            # Load image
+            # Load image (only the header is read until pixel data is needed)
             img = Image.open(io.BytesIO(img_bytes))
 
+            # A JPEG that needs no resize is kept as captured: decoding and
+            # re-encoding it would only lose quality
+            if format == 'jpeg' and not (max_width and img.width > max_width):
+                return img_bytes
+
             # Resize if needed
             if max_width and img.width > max_width:
                 ratio = max_width / img.width
@@ -11,6 +11,8 @@ logger = get_logger("commands.search")
 class FindElementsCommand(Command):
     """Find all elements matching criteria (text, tag, attributes)"""
 
+    __slots__ = ()
+
     name = "find_elements"
     description = """Find elements on the page (text, tag, attributes).
 
@@ -42,6 +44,8 @@ After calling this, use Read('./page_info.json') to see all interactive elements
 class GetPageStructureCommand(Command):
     """Get page structure overview (headings, links, buttons, forms)"""
 
+    __slots__ = ()
+
     name = "get_page_structure"
     description = """Get page structure (headings, links, buttons, forms).
 
@@ -12,6 +12,8 @@ logger = get_logger("commands.tabs")
 class ListTabsCommand(Command):
     """List all open browser tabs"""
 
+    __slots__ = ()
+
     name = "list_tabs"
     description = "List all open tabs in the browser"
     input_schema = {
@@ -54,6 +56,8 @@ class ListTabsCommand(Command):
 class CreateTabCommand(Command):
     """Create a new browser tab"""
 
+    __slots__ = ()
+
     name = "create_tab"
     description = "Create a new tab and optionally navigate to a URL"
     input_schema = {
@@ -102,6 +106,8 @@ class CreateTabCommand(Command):
 class CloseTabCommand(Command):
     """Close a browser tab"""
 
+    __slots__ = ()
+
     name = "close_tab"
     description = "Close a tab by ID (closes current tab if no ID provided)"
     input_schema = {
@@ -166,6 +172,8 @@ class CloseTabCommand(Command):
 class SwitchTabCommand(Command):
     """Switch to a different tab"""
 
+    __slots__ = ()
+
     name = "switch_tab"
     description = "Switch to a different tab by ID"
     input_schema = {
@@ -210,7 +218,6 @@ class SwitchTabCommand(Command):
 
             # Enable necessary domains
             target_tab.Page.enable()
-            target_tab.DOM.enable()
             target_tab.Runtime.enable()
             target_tab.Console.enable()
             target_tab.Network.enable()
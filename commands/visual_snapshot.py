@@ -17,6 +17,8 @@ class GetVisualSnapshotCommand(Command):
     Returns element positions, styles, colors, and layout structure in JSON format.
     """
 
+    __slots__ = ()
+
     name = "get_visual_snapshot"
     description = """Get lightweight visual snapshot as structured JSON (v3.0.0 feature).
 
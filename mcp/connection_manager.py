@@ -85,7 +85,6 @@ class SharedBrowserConnection:
         try:
             self.tab.Page.enable()
             self.tab.Runtime.enable()
-            self.tab.DOM.enable()
             self.tab.Console.enable()
             logger.debug("CDP domains enabled")
         except Exception as e:
@@ -253,7 +253,8 @@ class MCPJSONRPCServer:
         logger.info(f"  ⚡ Calling tool: {tool_name}")
         logger.debug(f"     Arguments: {_truncate_data(arguments, max_length=300)}")
 
-        if tool_name not in self.commands:
+        cmd_class = self.commands.get(tool_name)
+        if cmd_class is None:
             raise ValidationError(
                 f"Unknown tool: {tool_name}",
                 data={"tool_name": tool_name, "available_tools": list(self.commands.keys())}
@@ -272,10 +273,13 @@ class MCPJSONRPCServer:
             connection=self.connection
         )
 
-        # Get command class and instantiate with context
-        cmd_class = self.commands[tool_name]
+        # Instantiate the command with context
         cmd_instance = cmd_class(context=context)
 
+        # Any command not known to keep the page as-is invalidates cached page state
+        if not cmd_class.preserves_page_state and self.connection.cdp:
+            self.connection.cdp.page_state.clear()
+
         # Execute command with timing
         start_time = time.time()
         result = await cmd_instance.execute(**arguments)
@@ -287,9 +291,11 @@ class MCPJSONRPCServer:
         # Handle tab switching - update connection's tab reference
         if tool_name == 'switch_tab' and result.get('success') and 'newTab' in result:
             self.connection.tab = result.pop('newTab')  # Remove internal field from result
+            await self.connection.rebind_cdp()
             # Reinitialize cursor on new tab
             self.connection.cursor = self.connection.cursor.__class__(self.connection.tab)
             await self.connection.cursor.initialize()
+            await self.connection.cursor.register_for_new_documents()
 
         # Handle tab closing - clear reference if current tab was closed
         if tool_name == 'close_tab' and result.get('wasCurrentTab'):
@@ -0,0 +1,171 @@
+"""Unit tests for commands/registry.py
+
+Tests command discovery: the directory listing, registration order after
+the threaded imports, and the once-per-package guard with its force flag.
+"""
+import importlib
+import sys
+import uuid
+
+import pytest
+from commands.registry import CommandRegistry
+
+
+MODULE_TEMPLATE = '''import time
+from commands.registry import register
+
+time.sleep({delay})
+
+
+@register
+class {class_name}:
+    name = "{command_name}"
+'''
+
+
+@pytest.fixture
+def registry():
+    """Empty CommandRegistry, restored to its previous contents afterwards"""
+    saved_commands = dict(CommandRegistry._commands)
+    saved_discovered = set(CommandRegistry._discovered)
+    CommandRegistry.clear()
+    yield CommandRegistry
+    CommandRegistry.clear()
+    CommandRegistry._commands.update(saved_commands)
+    CommandRegistry._discovered.update(saved_discovered)
+
+
+@pytest.fixture
+def make_package(tmp_path, monkeypatch):
+    """Create a throwaway command package on sys.path; returns (name, path)"""
+    package_name = f"fake_commands_{uuid.uuid4().hex}"
+    package_dir = tmp_path / package_name
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield package_name, package_dir
+    for module_name in [m for m in sys.modules if m.split('.')[0] == package_name]:
+        del sys.modules[module_name]
+
+
+def write_command_module(package_dir, module, command_name, delay=0.0):
+    """Write a module registering one command after sleeping `delay` seconds"""
+    (package_dir / f"{module}.py").write_text(MODULE_TEMPLATE.format(
+        delay=delay,
+        class_name=f"{module.title().replace('_', '')}Command",
+        command_name=command_name
+    ))
+
+
+class TestDiscoverCommands:
+    """Test suite for CommandRegistry.discover_commands"""
+
+    def test_imports_only_python_modules(self, registry, make_package):
+        """Test that only top-level .py files (not __init__) are imported"""
+        package_name, package_dir = make_package
+        write_command_module(package_dir, "alpha", "alpha_cmd")
+        (package_dir / "notes.txt").write_text("not a module")
+        sub_package = package_dir / "sub"
+        sub_package.mkdir()
+        (sub_package / "__init__.py").write_text("raise RuntimeError('must not be imported')")
+
+        registry.discover_commands(package_name)
+
+        assert list(registry.get_all_commands()) == ["alpha_cmd"]
+        assert f"{package_name}.sub" not in sys.modules
+
+    def test_registration_follows_module_order(self, registry, make_package):
+        """Test that threaded imports still register commands in module order"""
+        package_name, package_dir = make_package
+        # The first module finishes importing last
+        write_command_module(package_dir, "a_slow", "first", delay=0.3)
+        write_command_module(package_dir, "b_fast", "second")
+        write_command_module(package_dir, "c_fast", "third")
+
+        registry.discover_commands(package_name)
+
+        assert list(registry.get_all_commands()) == ["first", "second", "third"]
+
+    def test_failing_module_is_skipped(self, registry, make_package):
+        """Test that a module raising on import does not stop discovery"""
+        package_name, package_dir = make_package
+        (package_dir / "broken.py").write_text("raise ImportError('missing dependency')")
+        write_command_module(package_dir, "working", "working_cmd")
+
+        registry.discover_commands(package_name)
+
+        assert list(registry.get_all_commands()) == ["working_cmd"]
+
+    def test_second_call_does_not_rescan(self, registry, make_package):
+        """Test that a package is only scanned once"""
+        package_name, package_dir = make_package
+        write_command_module(package_dir, "alpha", "alpha_cmd")
+        registry.discover_commands(package_name)
+
+        write_command_module(package_dir, "beta", "beta_cmd")
+        importlib.invalidate_caches()
+        registry.discover_commands(package_name)
+
+        assert list(registry.get_all_commands()) == ["alpha_cmd"]
+
+    def test_force_rescans(self, registry, make_package):
+        """Test that force=True picks up modules added since the last scan"""
+        package_name, package_dir = make_package
+        write_command_module(package_dir, "alpha", "alpha_cmd")
+        registry.discover_commands(package_name)
+
+        write_command_module(package_dir, "beta", "beta_cmd")
+        importlib.invalidate_caches()
+        registry.discover_commands(package_name, force=True)
+
+        assert list(registry.get_all_commands()) == ["alpha_cmd", "beta_cmd"]
+
+    def test_clear_allows_rediscovery(self, registry, make_package):
+        """Test that clear() resets the once-per-package guard"""
+        package_name, package_dir = make_package
+        write_command_module(package_dir, "alpha", "alpha_cmd")
+        registry.discover_commands(package_name)
+
+        registry.clear()
+        assert package_name not in registry._discovered
+        assert dict(registry.get_all_commands()) == {}
+
+
+class TestRegistryLookups:
+    """Test suite for CommandRegistry lookups"""
+
+    def test_get_command(self, registry):
+        """Test lookup of registered and unknown commands"""
+        @registry.register
+        class EchoCommand:
+            name = "echo"
+
+        assert registry.get_command("echo") is EchoCommand
+        with pytest.raises(KeyError):
+            registry.get_command("missing")
+
+    def test_get_all_commands_is_read_only_snapshot(self, registry):
+        """Test that the snapshot is shared, read-only and refreshed on register"""
+        @registry.register
+        class EchoCommand:
+            name = "echo"
+
+        snapshot = registry.get_all_commands()
+        assert registry.get_all_commands() is snapshot
+        with pytest.raises(TypeError):
+            snapshot["other"] = EchoCommand
+
+        @registry.register
+        class OtherCommand:
+            name = "other"
+
+        assert list(registry.get_all_commands()) == ["echo", "other"]
+        assert "other" not in snapshot
+
+    def test_register_requires_name(self, registry):
+        """Test that classes without a name are rejected"""
+        class NamelessCommand:
+            name = None
+
+        with pytest.raises(ValueError):
+            registry.register(NamelessCommand)
@@ -0,0 +1,95 @@
+"""Unit tests for the argument and scroll-state helpers in commands/interaction.py"""
+import time
+
+import pytest
+
+pytest.importorskip("pychrome")  # commands.* imports the browser context
+
+from commands.interaction import _SCROLL_EDGE_TTL, _int_in_range, _scroll_is_noop  # noqa: E402
+
+
+def scroll_state(position, direction="down", age=0.0):
+    """page_state["scroll_position"] entry as written by scroll_page"""
+    return {"position": position, "direction": direction, "time": time.monotonic() - age}
+
+
+class TestIntInRange:
+    """Test suite for _int_in_range"""
+
+    def test_missing_value_passes(self):
+        """Test that None (argument not given) passes"""
+        assert _int_in_range(None, 0, 10) is True
+
+    def test_bounds_are_inclusive(self):
+        """Test values at and inside the bounds"""
+        assert _int_in_range(0, 0, 10) is True
+        assert _int_in_range(5, 0, 10) is True
+        assert _int_in_range(10, 0, 10) is True
+
+    def test_out_of_range(self):
+        """Test values outside the bounds"""
+        assert _int_in_range(-1, 0, 10) is False
+        assert _int_in_range(11, 0, 10) is False
+
+    def test_non_int_values_need_validation(self):
+        """Test that anything but a plain int goes to the validators"""
+        assert _int_in_range(True, 0, 10) is False
+        assert _int_in_range(5.0, 0, 10) is False
+        assert _int_in_range("5", 0, 10) is False
+
+
+class TestScrollIsNoop:
+    """Test suite for _scroll_is_noop"""
+
+    def test_at_top(self):
+        """Test up/left/top at the origin"""
+        cached = scroll_state({"x": 0, "y": 0})
+        assert _scroll_is_noop("up", cached) is True
+        assert _scroll_is_noop("left", cached) is True
+        assert _scroll_is_noop("top", cached) is True
+
+    def test_not_at_top(self):
+        """Test up/left/top away from the origin"""
+        cached = scroll_state({"x": 30, "y": 200})
+        assert _scroll_is_noop("up", cached) is False
+        assert _scroll_is_noop("left", cached) is False
+        assert _scroll_is_noop("top", cached) is False
+
+    def test_stale_cache_is_ignored_for_every_edge(self):
+        """Test that an expired entry never skips a scroll"""
+        age = _SCROLL_EDGE_TTL + 0.5
+        at_origin = scroll_state({"x": 0, "y": 0}, age=age)
+        at_end = scroll_state({"x": 0, "y": 900, "maxX": 0, "maxY": 900}, age=age)
+
+        for direction in ("up", "left", "top"):
+            assert _scroll_is_noop(direction, at_origin) is False
+        for direction in ("down", "right", "bottom"):
+            assert _scroll_is_noop(direction, at_end) is False
+
+    def test_bottom_from_detailed_metrics(self):
+        """Test down/right/bottom against maxX/maxY"""
+        at_end = scroll_state({"x": 0, "y": 900, "maxX": 0, "maxY": 900})
+        assert _scroll_is_noop("down", at_end) is True
+        assert _scroll_is_noop("right", at_end) is True
+        assert _scroll_is_noop("bottom", at_end) is True
+
+        midway = scroll_state({"x": 0, "y": 400, "maxX": 0, "maxY": 900})
+        assert _scroll_is_noop("down", midway) is False
+        assert _scroll_is_noop("bottom", midway) is False
+
+    def test_bottom_from_limited_flag(self):
+        """Test down/bottom from a previous short scroll without metrics"""
+        limited = scroll_state({"x": 0, "y": 900, "limited": True}, direction="down")
+        assert _scroll_is_noop("down", limited) is True
+        assert _scroll_is_noop("bottom", limited) is True
+        assert _scroll_is_noop("right", limited) is False
+
+        # "limited" only describes the direction that produced it
+        after_up = scroll_state({"x": 0, "y": 900, "limited": True}, direction="up")
+        assert _scroll_is_noop("down", after_up) is False
+
+    def test_unknown_position(self):
+        """Test that results without offsets (e.g. failed helper) never skip"""
+        cached = scroll_state({})
+        for direction in ("up", "down", "left", "right", "top", "bottom"):
+            assert _scroll_is_noop(direction, cached) is False
@@ -0,0 +1,120 @@
+"""Unit tests for the JSON output writers in utils/page_scraper.py
+
+Tests atomic replacement of output files, orjson/stdlib output parity and
+cleanup after a failed write.
+"""
+import asyncio
+import json
+
+import pytest
+import utils.page_scraper as page_scraper
+from utils.page_scraper import PageScraper
+
+
+SAMPLE = {
+    "url": "https://example.com/",
+    "title": "Überschrift ✓",
+    "interactive_elements": [
+        {"tag": "button", "text": "OK", "id": None, "position": {"x": 10, "y": 20}},
+        {"tag": "a", "text": "Link", "id": "nav", "position": {"x": 1.5, "y": 0}}
+    ],
+    "forms": [],
+    "summary": {"visible_interactive": 2, "page_loaded": True}
+}
+
+
+def expected_bytes(data):
+    """The reference output: indented, non-ASCII kept as UTF-8"""
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def serializer(request, monkeypatch):
+    """Run a test once with orjson (if installed) and once with the stdlib"""
+    if request.param:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr(page_scraper, "ORJSON_AVAILABLE", request.param)
+    return request.param
+
+
+class TestWriteJson:
+    """Test suite for _write_json / _write_atomic"""
+
+    def test_output_matches_stdlib_format(self, tmp_path, serializer):
+        """Test that both serializers write identical bytes"""
+        output_file = tmp_path / "page_info.json"
+
+        size = page_scraper._write_json(str(output_file), SAMPLE)
+
+        assert output_file.read_bytes() == expected_bytes(SAMPLE)
+        assert size == output_file.stat().st_size
+
+    def test_replaces_existing_file(self, tmp_path, serializer):
+        """Test that an existing file is replaced and no temp file remains"""
+        output_file = tmp_path / "page_info.json"
+        output_file.write_text("old contents")
+
+        page_scraper._write_json(str(output_file), SAMPLE)
+
+        assert json.loads(output_file.read_text(encoding='utf-8')) == SAMPLE
+        assert [p.name for p in tmp_path.iterdir()] == ["page_info.json"]
+
+    def test_creates_missing_directories(self, tmp_path, serializer):
+        """Test that the output directory is created on demand"""
+        output_file = tmp_path / "nested" / "dir" / "page_info.json"
+
+        page_scraper._write_json(str(output_file), SAMPLE)
+
+        assert output_file.read_bytes() == expected_bytes(SAMPLE)
+
+    def test_failed_write_keeps_previous_file(self, tmp_path, serializer):
+        """Test that a serialization error leaves the old file and no temp file"""
+        output_file = tmp_path / "page_info.json"
+        output_file.write_text("previous")
+
+        with pytest.raises(TypeError):
+            page_scraper._write_json(str(output_file), {"elements": [1, object()]})
+
+        assert output_file.read_text() == "previous"
+        assert [p.name for p in tmp_path.iterdir()] == ["page_info.json"]
+
+    def test_large_integers_fall_back_to_stdlib(self, tmp_path, serializer):
+        """Test that values orjson rejects are still written"""
+        output_file = tmp_path / "page_info.json"
+        data = {"big": 2 ** 70}
+
+        page_scraper._write_json(str(output_file), data)
+
+        assert output_file.read_bytes() == expected_bytes(data)
+
+    def test_write_bytes(self, tmp_path):
+        """Test that raw payloads are written unchanged"""
+        output_file = tmp_path / "page_info.json"
+
+        size = page_scraper._write_bytes(str(output_file), b'{"a": 1}')
+
+        assert output_file.read_bytes() == b'{"a": 1}'
+        assert size == 8
+
+
+class TestPageScraperWriters:
+    """Test suite for the async PageScraper writers"""
+
+    def test_write_json(self, tmp_path):
+        """Test that write_json writes the file and returns its size"""
+        output_file = tmp_path / "page_info.json"
+
+        size = asyncio.run(PageScraper.write_json(SAMPLE, str(output_file)))
+
+        assert json.loads(output_file.read_text(encoding='utf-8')) == SAMPLE
+        assert size == output_file.stat().st_size
+
+    def test_write_text(self, tmp_path):
+        """Test that write_text encodes as UTF-8 and returns the byte count"""
+        output_file = tmp_path / "page_info.json"
+        text = '{"title": "Überschrift"}'
+
+        size = asyncio.run(PageScraper.write_text(text, str(output_file)))
+
+        assert output_file.read_text(encoding='utf-8') == text
+        assert size == len(text.encode('utf-8'))
@@ -2,49 +2,155 @@
 Shared utilities for page scraping and element extraction
 Eliminates code duplication across search/devtools/diagnostics commands
 """
+import asyncio
 import json
 import os
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, BinaryIO, Callable, Optional, Set
 from browser.async_cdp import AsyncCDP
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Output directories already created by _write_atomic in this process
+_created_dirs: Set[str] = set()
+
+
+def _write_json(output_file: str, data: Any) -> int:
+    """Write data as indented UTF-8 JSON; returns the number of bytes written"""
+    if ORJSON_AVAILABLE:
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; the stdlib handles those
+        else:
+            return _write_bytes(output_file, payload)
+
+    # The stdlib encoder's chunks are streamed into the file as produced,
+    # instead of first building the whole document as one string
+    chunks = json.JSONEncoder(indent=2, ensure_ascii=False).iterencode(data)
+    return _write_atomic(output_file, lambda f: f.writelines(chunk.encode('utf-8') for chunk in chunks))
+
+
+def _write_bytes(output_file: str, payload: bytes) -> int:
+    """Atomically replace output_file with payload; returns the number of bytes written"""
+    return _write_atomic(output_file, lambda f: f.write(payload))
+
+
+def _write_atomic(output_file: str, write: Callable[[BinaryIO], Any]) -> int:
+    """Atomically replace output_file with what write() puts in a binary file
+
+    The data goes to a temporary file in the same directory first, so readers
+    never see a half-written file and a failed write keeps the previous one.
+
+    Args:
+        output_file: Destination path
+        write: Called with the open temporary file
+
+    Returns:
+        Number of bytes written
+    """
+    # The default ./page_info.json lives in the working directory, which exists;
+    # other directories are created once per process
+    directory = os.path.dirname(output_file)
+    if directory not in ('', '.') and directory not in _created_dirs:
+        os.makedirs(directory, exist_ok=True)
+        _created_dirs.add(directory)
+
+    # Unique per writer thread; created by open() so the usual umask applies
+    tmp_path = f"{output_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        try:
+            f = open(tmp_path, 'wb')
+        except FileNotFoundError:
+            if directory in ('', '.'):
+                raise
+            # Directory removed since it was created - create it again
+            os.makedirs(directory, exist_ok=True)
+            f = open(tmp_path, 'wb')
+        with f:
+            write(f)
+            size = f.tell()
+        os.replace(tmp_path, output_file)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+    return size
+
 
 class PageScraper:
     """Centralized page scraping logic"""
 
-    # Shared JavaScript for getting interactive elements
+    # Shared JavaScript for getting interactive elements; an async function of
+    # the maximum number of element entries to return (0 = no limit)
     JS_GET_INTERACTIVE_ELEMENTS = """
-    (function() {
+    (async function(maxInteractive) {
+        // A snapshot taken right after navigation waits for the load event
+        // here, in the same round-trip, rather than scraping a half-built page
+        if (document.readyState !== 'complete') {
+            await new Promise(resolve => {
+                window.addEventListener('load', resolve, {once: true});
+                setTimeout(resolve, 10000);
+            });
+        }
+
         function getVisibleText(el) {
             if (!el) return '';
-            const style = window.getComputedStyle(el);
-            if (style.display === 'none' || style.visibility === 'hidden') return '';
+            // checkVisibility() avoids resolving a full computed style
+            if (el.checkVisibility) {
+                if (!el.checkVisibility({checkVisibilityCSS: true})) return '';
+            } else {
+                const style = window.getComputedStyle(el);
+                if (style.display === 'none' || style.visibility === 'hidden') return '';
+            }
             return (el.innerText || el.textContent || '').trim();
         }
 
-        const interactive = Array.from(document.querySelectorAll('button, a, [role="button"], [role="tab"]'))
-            .filter(el => {
-                const rect = el.getBoundingClientRect();
-                return rect.width > 0 && rect.height > 0 && el.offsetParent !== null;
-            })
-            .map(el => {
-                const rect = el.getBoundingClientRect();
-                return {
-                    tag: el.tagName.toLowerCase(),
-                    text: getVisibleText(el).substring(0, 100),
-                    id: el.id || null,
-                    classes: Array.from(el.classList || []),
-                    position: {
-                        x: Math.round(rect.left + rect.width/2),
-                        y: Math.round(rect.top + rect.height/2)
-                    }
-                };
+        // Geometry is read for all candidates first, then styles and texts for
+        // the visible ones: one rect per element, and no layout reads
+        // interleaved with the per-element style/text work
+        const candidates = document.querySelectorAll('button, a, [role="button"], [role="tab"]');
+        const rects = new Array(candidates.length);
+        for (let i = 0; i < candidates.length; i++) {
+            rects[i] = candidates[i].getBoundingClientRect();
+        }
+
+        // Entries past the cap are only counted, so CDP never has to
+        // serialize them
+        const limit = maxInteractive > 0 ? maxInteractive : Infinity;
+        const interactive = [];
+        let visibleCount = 0;
+        for (let i = 0; i < candidates.length; i++) {
+            const el = candidates[i];
+            const rect = rects[i];
+            if (!(rect.width > 0 && rect.height > 0 && el.offsetParent !== null)) continue;
+            if (visibleCount++ >= limit) continue;
+            interactive.push({
+                tag: el.tagName.toLowerCase(),
+                text: getVisibleText(el).substring(0, 100),
+                id: el.id || null,
+                classes: Array.from(el.classList || []),
+                position: {
+                    x: Math.round(rect.left + rect.width/2),
+                    y: Math.round(rect.top + rect.height/2)
+                }
             });
+        }
 
         // Get console logs if available
         const consoleLogs = window.__consoleHistory || [];
 
         // Get network info
         const networkEntries = performance.getEntriesByType('resource') || [];
+        let failedRequests = 0;
+        for (const entry of networkEntries) {
+            if (entry.transferSize === 0) failedRequests++;
+        }
 
         return {
             url: window.location.href,
@@ -60,7 +166,7 @@ class PageScraper:
             },
             network: {
                 total_requests: networkEntries.length,
-                failed: networkEntries.filter(e => e.transferSize === 0).length,
+                failed: failedRequests,
                 recent: networkEntries.slice(-5).map(e => ({
                     name: e.name.split('/').pop().substring(0, 50),
                     type: e.initiatorType,
@@ -68,32 +174,65 @@ class PageScraper:
                 }))
             },
             summary: {
-                total_buttons: document.querySelectorAll('button').length,
-                total_links: document.querySelectorAll('a').length,
-                visible_interactive: interactive.length,
+                // Live collections: counted without building a static NodeList
+                total_buttons: document.getElementsByTagName('button').length,
+                total_links: document.getElementsByTagName('a').length,
+                visible_interactive: visibleCount,
                 page_loaded: document.readyState === 'complete'
             }
         };
-    })()
+    })
     """
 
     @staticmethod
-    async def get_page_info(cdp: AsyncCDP) -> Dict[str, Any]:
+    async def get_page_info(cdp: AsyncCDP, max_interactive: int = 0) -> Dict[str, Any]:
         """
         Get comprehensive page information using CDP
 
         Args:
             cdp: AsyncCDP wrapper for thread-safe evaluation
+            max_interactive: Maximum interactive elements to return (0 = no limit)
 
         Returns:
             Dictionary with page info (interactive elements, console, network, summary)
         """
         result = await cdp.evaluate(
-            expression=PageScraper.JS_GET_INTERACTIVE_ELEMENTS,
-            returnByValue=True
+            expression=f"{PageScraper.JS_GET_INTERACTIVE_ELEMENTS}({int(max_interactive)})",
+            returnByValue=True,
+            awaitPromise=True
         )
         return result.get('result', {}).get('value', {})
 
+    @staticmethod
+    async def write_json(data: Any, output_file: str) -> int:
+        """
+        Serialize and write JSON off the event loop
+
+        Args:
+            data: JSON-serializable data
+            output_file: Output file path
+
+        Returns:
+            Size of the written file in bytes
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, _write_json, output_file, data)
+
+    @staticmethod
+    async def write_text(text: str, output_file: str) -> int:
+        """
+        Write already serialized (e.g. page-side JSON.stringify) text off the event loop
+
+        Args:
+            text: File contents
+            output_file: Output file path
+
+        Returns:
+            Size of the written file in bytes
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, _write_bytes, output_file, text.encode('utf-8'))
+
     @staticmethod
     async def save_to_file(
         data: Dict[str, Any],
@@ -109,15 +248,7 @@ class PageScraper:
         Returns:
             Success result with file info
         """
-        # Create directory if needed
-        os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
-
-        # Save to file
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-
-        # Calculate size
-        file_size = os.path.getsize(output_file)
+        file_size = await PageScraper.write_json(data, output_file)
         size_kb = round(file_size / 1024, 1)
 
         return {
@@ -136,7 +267,8 @@ class PageScraper:
     @staticmethod
     async def scrape_and_save(
         cdp: AsyncCDP,
-        output_file: str = "./page_info.json"
+        output_file: str = "./page_info.json",
+        max_interactive: int = 0
     ) -> Dict[str, Any]:
         """
         Combined scrape + save operation (most common use case)
@@ -144,12 +276,13 @@ class PageScraper:
         Args:
             cdp: AsyncCDP wrapper
             output_file: Output file path
+            max_interactive: Maximum interactive elements to return (0 = no limit)
 
         Returns:
             Success result with file info
         """
         try:
-            page_info = await PageScraper.get_page_info(cdp)
+            page_info = await PageScraper.get_page_info(cdp, max_interactive)
             return await PageScraper.save_to_file(page_info, output_file)
         except Exception as e:
             return {
@@ -224,7 +224,8 @@ class Validators:
     def validate_selector(
         selector: str,
         param_name: str = "selector",
-        allow_xpath: bool = True
+        allow_xpath: bool = True,
+        sanitize: bool = True
     ) -> str:
         """Validate CSS/XPath selector
 
@@ -232,6 +233,9 @@ class Validators:
             selector: CSS or XPath selector
             param_name: Parameter name for error messages
             allow_xpath: Whether to allow XPath selectors (starting with //)
+            sanitize: Whether to reject script-like patterns. Pass False when the
+                selector is handed to the page as an argument value rather than
+                spliced into JS source
 
         Returns:
             Validated selector string
@@ -265,6 +269,9 @@ class Validators:
                 )
             return selector
 
+        if not sanitize:
+            return selector
+
         # Basic CSS selector validation (not exhaustive, just catch obvious errors)
         # Disallow dangerous patterns
         dangerous_patterns = [